@@ -1,7 +1,8 @@
 from fastapi import Depends, HTTPException, status, Cookie
 from sqlmodel import Session, select
-from typing import Optional, Annotated
+from typing import List, Optional, Annotated
 
+from app.core.config import settings
 from app.core.database import get_session
 from app.core.security import decode_access_token
 from app.models.user import User
@@ -87,3 +88,34 @@ async def get_admin_user(
     #     )
     
     return current_user
+
+
+def parse_id_list(ids: str) -> List[int]:
+    """
+    Parse a comma-separated id list from a query parameter
+    
+    Duplicates are dropped, keeping the first occurrence's position.
+    
+    Raises:
+        HTTPException: 400 if an id is not an integer or there are too many
+    """
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers"
+        )
+    
+    unique_ids = list(dict.fromkeys(parsed))
+    if not unique_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must contain at least one id"
+        )
+    if len(unique_ids) > settings.MAX_LOOKUP_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.MAX_LOOKUP_IDS} ids can be looked up at once"
+        )
+    return unique_ids
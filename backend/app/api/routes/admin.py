@@ -1,14 +1,28 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select, func
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, case, extract
+from sqlmodel import Session, select, func, update
 from pydantic import BaseModel
-from datetime import datetime, date
-from typing import List
+from datetime import datetime, date, timedelta
+from typing import Iterator, List, Literal
+import csv
+import io
+import json
 
-from app.core.database import get_session
+from app.core.availability_template import availability_template
+from app.core.cache import analytics_cache, invalidate_booking_dates, occupancy_cache, slot_cache
+from app.core.config import settings
+from app.core.database import engine, get_session
+from app.core.email import send_status_updates
+from app.core.service_catalog import service_catalog
+from app.core.slot_engine import MINUTES_PER_DAY
+from app.core.utilization import daily_utilization, weekday_minutes
 from app.models.user import User
 from app.models.service import Service
 from app.models.booking import Booking
+from app.models.daily_stats import DailyStats
 from app.api.deps import get_admin_user
+from app.api.routes.bookings import check_booking_conflict, promote_waitlist, reject_overlapping_writes
 
 
 router = APIRouter()
@@ -41,6 +55,19 @@ class BookingWithDetails(BaseModel):
     service_price: float
 
 
+class BookingStatusBulkUpdate(BaseModel):
+    """Schema for changing the status of many bookings"""
+    booking_ids: List[int]
+    status: Literal["pending", "confirmed", "cancelled"]
+
+
+class BookingStatusBulkResponse(BaseModel):
+    """Schema for bulk status change response"""
+    status: str
+    updated: List[int]
+    unchanged: List[int]  # Already had the target status
+
+
 class RevenueByService(BaseModel):
     """Schema for revenue breakdown by service"""
     service_name: str
@@ -48,6 +75,83 @@ class RevenueByService(BaseModel):
     total_revenue: float
 
 
+class TimeseriesPoint(BaseModel):
+    """Schema for one period of a time series"""
+    period_start: date
+    value: int | float
+
+
+class TimeseriesResponse(BaseModel):
+    """Schema for a bookings or revenue time series"""
+    metric: str
+    granularity: str
+    date_from: date
+    date_to: date
+    points: List[TimeseriesPoint]
+
+
+class UtilizationDay(BaseModel):
+    """Schema for one day of the utilization report"""
+    day: date
+    available_minutes: int
+    booked_minutes: int
+    utilization: float | None  # None on days without working hours
+
+
+class UtilizationResponse(BaseModel):
+    """Schema for booked vs available minutes over a date range"""
+    date_from: date
+    date_to: date
+    available_minutes: int
+    booked_minutes: int
+    utilization: float | None
+    days: List[UtilizationDay]
+
+
+def rollup_stats_query(first_day_of_month: date):
+    """
+    Dashboard figures read from the daily_stats rollup
+    
+    Sums one row per (day, service) instead of scanning the bookings. The
+    user and service totals are scalar subqueries in the same statement.
+    """
+    day_total = DailyStats.booking_count
+    is_this_month = DailyStats.day >= first_day_of_month
+    return select(
+        select(func.count(User.id)).scalar_subquery(),
+        select(func.count(Service.id)).scalar_subquery(),
+        func.coalesce(func.sum(day_total), 0),
+        func.coalesce(func.sum(DailyStats.pending_count), 0),
+        func.coalesce(func.sum(DailyStats.confirmed_count), 0),
+        func.coalesce(func.sum(DailyStats.cancelled_count), 0),
+        func.coalesce(func.sum(DailyStats.confirmed_revenue), 0.0),
+        func.coalesce(func.sum(case((is_this_month, day_total), else_=0)), 0),
+        func.coalesce(func.sum(case((is_this_month, DailyStats.confirmed_revenue), else_=0.0)), 0.0)
+    ).select_from(DailyStats)
+
+
+def booking_stats_query(first_day_of_month: date):
+    """
+    Dashboard figures aggregated from the bookings in one pass
+    
+    Conditional aggregates give every count and price * bookings revenue;
+    the user and service totals are scalar subqueries.
+    """
+    is_confirmed = Booking.status == "confirmed"
+    is_this_month = Booking.booking_date >= first_day_of_month
+    return select(
+        select(func.count(User.id)).scalar_subquery(),
+        select(func.count(Service.id)).scalar_subquery(),
+        func.count(Booking.id),
+        func.coalesce(func.sum(case((Booking.status == "pending", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((is_confirmed, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Booking.status == "cancelled", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((is_confirmed, Service.price), else_=0.0)), 0.0),
+        func.coalesce(func.sum(case((is_this_month, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((and_(is_confirmed, is_this_month), Service.price), else_=0.0)), 0.0)
+    ).select_from(Booking).join(Service, Service.id == Booking.service_id)
+
+
 @router.get("/stats", response_model=DashboardStats)
 async def get_dashboard_stats(
     session: Session = Depends(get_session),
@@ -61,67 +165,26 @@ async def get_dashboard_stats(
     - Booking status breakdown
     - Revenue metrics (total and current month)
     """
-    # Total Users
-    total_users = session.exec(select(func.count(User.id))).one()
-    
-    # Total Services
-    total_services = session.exec(select(func.count(Service.id))).one()
-    
-    # Total Bookings
-    total_bookings = session.exec(select(func.count(Booking.id))).one()
-    
-    # Pending Bookings
-    pending_bookings = session.exec(
-        select(func.count(Booking.id)).where(Booking.status == "pending")
-    ).one()
-    
-    # Confirmed Bookings
-    confirmed_bookings = session.exec(
-        select(func.count(Booking.id)).where(Booking.status == "confirmed")
-    ).one()
-    
-    # Cancelled Bookings
-    cancelled_bookings = session.exec(
-        select(func.count(Booking.id)).where(Booking.status == "cancelled")
-    ).one()
-    
-    # Total Revenue (from confirmed bookings)
-    confirmed_booking_ids = session.exec(
-        select(Booking.service_id).where(Booking.status == "confirmed")
-    ).all()
-    
-    total_revenue = 0.0
-    if confirmed_booking_ids:
-        services = session.exec(
-            select(Service).where(Service.id.in_(confirmed_booking_ids))
-        ).all()
-        total_revenue = sum(service.price for service in services)
-    
-    # Get first day of current month
+    # First day of the current month, for the "this month" figures
     today = datetime.now()
     first_day_of_month = date(today.year, today.month, 1)
     
-    # Bookings This Month
-    bookings_this_month = session.exec(
-        select(func.count(Booking.id)).where(
-            Booking.booking_date >= first_day_of_month
-        )
-    ).one()
-    
-    # Revenue This Month (confirmed bookings only)
-    confirmed_bookings_this_month = session.exec(
-        select(Booking.service_id).where(
-            Booking.booking_date >= first_day_of_month,
-            Booking.status == "confirmed"
-        )
-    ).all()
-    
-    revenue_this_month = 0.0
-    if confirmed_bookings_this_month:
-        services = session.exec(
-            select(Service).where(Service.id.in_(confirmed_bookings_this_month))
-        ).all()
-        revenue_this_month = sum(service.price for service in services)
+    if engine.dialect.name == "sqlite":
+        stats = session.exec(rollup_stats_query(first_day_of_month)).one()
+    else:
+        # No daily_stats triggers outside SQLite; aggregate the bookings directly
+        stats = session.exec(booking_stats_query(first_day_of_month)).one()
+    (
+        total_users,
+        total_services,
+        total_bookings,
+        pending_bookings,
+        confirmed_bookings,
+        cancelled_bookings,
+        total_revenue,
+        bookings_this_month,
+        revenue_this_month
+    ) = stats
     
     return DashboardStats(
         total_users=total_users,
@@ -147,28 +210,252 @@ async def get_recent_bookings(
     
     - **limit**: Number of recent bookings to return (default: 10)
     """
-    # Get recent bookings
-    statement = select(Booking).order_by(Booking.created_at.desc()).limit(limit)
-    bookings = session.exec(statement).all()
+    # Recent bookings with their user and service, in one joined query
+    statement = (
+        select(Booking, User.full_name, User.email, Service.name, Service.price)
+        .join(User, User.id == Booking.user_id)
+        .join(Service, Service.id == Booking.service_id)
+        .order_by(Booking.created_at.desc())
+        .limit(limit)
+    )
     
-    result = []
-    for booking in bookings:
-        user = session.get(User, booking.user_id)
-        service = session.get(Service, booking.service_id)
-        
-        result.append(BookingWithDetails(
+    return [
+        BookingWithDetails(
             booking_id=booking.id,
             booking_date=booking.booking_date,
             start_time=str(booking.start_time),
             end_time=str(booking.end_time),
             status=booking.status,
-            user_name=user.full_name,
-            user_email=user.email,
-            service_name=service.name,
-            service_price=service.price
-        ))
+            user_name=user_name,
+            user_email=user_email,
+            service_name=service_name,
+            service_price=service_price
+        )
+        for booking, user_name, user_email, service_name, service_price in session.exec(statement)
+    ]
+
+
+@router.post("/bookings/status", response_model=BookingStatusBulkResponse)
+async def update_bookings_status(
+    status_data: BookingStatusBulkUpdate,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Change the status of many bookings at once (Admin only)
     
-    return result
+    Bookings, users and services are loaded with one joined query, the
+    change is written with a single UPDATE ... WHERE id IN (...) and one
+    commit, and all status emails are queued as one background task.
+    Cancelled slots are offered to the waitlist. Bookings taken out of
+    cancelled are checked against active holds and bookings first, like
+    a new booking; if any slot is taken, nothing is changed.
+    
+    - **booking_ids**: Bookings to change; unknown ids fail the whole request
+    - **status**: Target status
+    """
+    booking_ids = sorted(set(status_data.booking_ids))
+    if not booking_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one booking id is required"
+        )
+    
+    if len(booking_ids) > settings.MAX_BULK_STATUS_UPDATES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.MAX_BULK_STATUS_UPDATES} bookings can be updated at once"
+        )
+    
+    statement = (
+        select(Booking, User, Service)
+        .join(User, User.id == Booking.user_id)
+        .join(Service, Service.id == Booking.service_id)
+        .where(Booking.id.in_(booking_ids))
+    )
+    rows = session.exec(statement).all()
+    
+    missing = set(booking_ids) - {booking.id for booking, _, _ in rows}
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Bookings not found: {', '.join(str(booking_id) for booking_id in sorted(missing))}"
+        )
+    
+    new_status = status_data.status
+    # (booking, user, service, old status) for bookings that actually change
+    changes = [
+        (booking, user, service, booking.status)
+        for booking, user, service in rows
+        if booking.status != new_status
+    ]
+    changed_ids = [booking.id for booking, _, _, _ in changes]
+    
+    if new_status != "cancelled":
+        # Check and update with no await in between, as create_booking does
+        taken_ids = [
+            booking.id
+            for booking, _, _, old_status in changes
+            if old_status == "cancelled" and check_booking_conflict(
+                session, booking.booking_date, booking.start_time, booking.end_time,
+                exclude_booking_id=booking.id, hold_user_id=booking.user_id
+            )
+        ]
+        if taken_ids:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Time slot is already booked for bookings: {', '.join(str(booking_id) for booking_id in taken_ids)}"
+            )
+    
+    dates = {booking.booking_date for booking, _, _, _ in changes}
+    
+    # Build everything from the loaded rows before commit expires them
+    freed_slots = [
+        (booking.booking_date, booking.start_time, booking.end_time)
+        for booking, _, _, _ in changes
+        if new_status == "cancelled"
+    ]
+    notifications = [
+        {
+            "user_email": user.email,
+            "user_name": user.full_name,
+            "service_name": service.name,
+            "booking_date": str(booking.booking_date),
+            "start_time": str(booking.start_time),
+            "old_status": old_status,
+            "new_status": new_status
+        }
+        for booking, user, service, old_status in changes
+    ]
+    
+    if changes:
+        # Bookings un-cancelled together can still collide with each
+        # other; the overlap trigger rejects the whole statement then
+        with reject_overlapping_writes(session):
+            session.exec(
+                update(Booking)
+                .where(Booking.id.in_(changed_ids))
+                .values(status=new_status)
+            )
+            session.commit()
+        
+        invalidate_booking_dates(*dates)
+        
+        if freed_slots:
+            background_tasks.add_task(promote_waitlist, freed_slots)
+        background_tasks.add_task(send_status_updates, notifications)
+    
+    return BookingStatusBulkResponse(
+        status=new_status,
+        updated=changed_ids,
+        unchanged=sorted(set(booking_ids) - set(changed_ids))
+    )
+
+
+EXPORT_COLUMNS = [
+    "booking_id", "booking_date", "start_time", "end_time", "status", "created_at",
+    "user_name", "user_email", "service_name", "service_price"
+]
+
+
+def iter_booking_export_rows(
+    date_from: date | None,
+    date_to: date | None,
+    status_filter: str | None
+) -> Iterator[tuple]:
+    """
+    Stream booking rows joined with user and service details
+    
+    Uses its own session, since the request session is closed before a
+    streamed body is sent, and fetches EXPORT_BATCH_SIZE rows at a time
+    from a server-side cursor so memory stays flat.
+    """
+    statement = (
+        select(
+            Booking.id, Booking.booking_date, Booking.start_time, Booking.end_time,
+            Booking.status, Booking.created_at,
+            User.full_name, User.email, Service.name, Service.price
+        )
+        .join(User, User.id == Booking.user_id)
+        .join(Service, Service.id == Booking.service_id)
+        .order_by(Booking.booking_date, Booking.start_time, Booking.id)
+        .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+    )
+    if date_from is not None:
+        statement = statement.where(Booking.booking_date >= date_from)
+    if date_to is not None:
+        statement = statement.where(Booking.booking_date <= date_to)
+    if status_filter is not None:
+        statement = statement.where(Booking.status == status_filter)
+    
+    with Session(engine) as session:
+        yield from session.exec(statement)
+
+
+def stream_bookings_csv(rows: Iterator[tuple]) -> Iterator[str]:
+    """Encode rows as CSV, one chunk per EXPORT_BATCH_SIZE rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()  # Send the header before the first query returns
+    
+    count = 0
+    buffer.seek(0)
+    buffer.truncate()
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+        if count % settings.EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_bookings_ndjson(rows: Iterator[tuple]) -> Iterator[str]:
+    """Encode rows as newline-delimited JSON, one chunk per EXPORT_BATCH_SIZE rows"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=str) + "\n")
+        if len(lines) >= settings.EXPORT_BATCH_SIZE:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+@router.get("/bookings/export")
+async def export_bookings(
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    date_from: date | None = Query(None, description="Earliest booking date, inclusive"),
+    date_to: date | None = Query(None, description="Latest booking date, inclusive"),
+    status_filter: str | None = Query(None, alias="status", description="Only bookings with this status"),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Stream every booking with user and service details (Admin only)
+    
+    Rows are read from a server-side cursor and written out as they
+    arrive, so memory use does not grow with the table and the download
+    starts immediately.
+    
+    - **format**: csv (with a header row) or ndjson (one JSON object per line)
+    """
+    rows = iter_booking_export_rows(date_from, date_to, status_filter)
+    filename = f"bookings-{datetime.now().strftime('%Y%m%d')}.{export_format}"
+    
+    if export_format == "csv":
+        body, media_type = stream_bookings_csv(rows), "text/csv"
+    else:
+        body, media_type = stream_bookings_ndjson(rows), "application/x-ndjson"
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 
 @router.get("/revenue/by-service", response_model=List[RevenueByService])
@@ -181,27 +468,48 @@ async def get_revenue_by_service(
     
     Shows how much revenue each service has generated from confirmed bookings
     """
-    # Get all services
-    services = session.exec(select(Service)).all()
-    
-    result = []
-    for service in services:
-        # Count confirmed bookings for this service
-        bookings_count = session.exec(
-            select(func.count(Booking.id)).where(
-                Booking.service_id == service.id,
-                Booking.status == "confirmed"
+    if engine.dialect.name == "sqlite":
+        # Sum the daily_stats rows of every service in one grouped query
+        total_revenue = func.coalesce(func.sum(DailyStats.confirmed_revenue), 0.0)
+        rows = session.exec(
+            select(
+                Service.name,
+                func.coalesce(func.sum(DailyStats.confirmed_count), 0),
+                total_revenue
             )
-        ).one()
-        
-        # Calculate revenue
-        total_revenue = bookings_count * service.price
-        
-        result.append(RevenueByService(
-            service_name=service.name,
-            bookings_count=bookings_count,
-            total_revenue=total_revenue
-        ))
+            .select_from(Service)
+            .outerjoin(DailyStats, DailyStats.service_id == Service.id)
+            .group_by(Service.id)
+            .order_by(total_revenue.desc(), Service.id)
+        ).all()
+        return [
+            RevenueByService(
+                service_name=service_name,
+                bookings_count=bookings_count,
+                total_revenue=service_revenue
+            )
+            for service_name, bookings_count, service_revenue in rows
+        ]
+    
+    # No daily_stats triggers outside SQLite; count confirmed bookings per
+    # service in one grouped query
+    bookings_count = func.count(Booking.id)
+    rows = session.exec(
+        select(Service.name, Service.price, bookings_count)
+        .select_from(Service)
+        .outerjoin(Booking, and_(Booking.service_id == Service.id, Booking.status == "confirmed"))
+        .group_by(Service.id)
+        .order_by(Service.id)
+    ).all()
+    
+    result = [
+        RevenueByService(
+            service_name=service_name,
+            bookings_count=count,
+            total_revenue=count * price
+        )
+        for service_name, price, count in rows
+    ]
     
     # Sort by revenue descending
     result.sort(key=lambda x: x.total_revenue, reverse=True)
@@ -244,3 +552,220 @@ async def get_users_summary(
         "customers": customers,
         "admins": admins
     }
+
+
+def validate_analytics_range(date_from: date, date_to: date) -> None:
+    """Reject reversed ranges and ranges longer than MAX_ANALYTICS_RANGE_DAYS"""
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="from must not be after to"
+        )
+    
+    if (date_to - date_from).days + 1 > settings.MAX_ANALYTICS_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range can span at most {settings.MAX_ANALYTICS_RANGE_DAYS} days"
+        )
+
+
+def get_period_start(day: date, granularity: str) -> date:
+    """First day of the day/week/month period containing day (weeks start on Monday)"""
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def get_next_period_start(period_start: date, granularity: str) -> date:
+    """First day of the period after the one starting on period_start"""
+    if granularity == "week":
+        return period_start + timedelta(days=7)
+    if granularity == "month":
+        if period_start.month == 12:
+            return date(period_start.year + 1, 1, 1)
+        return date(period_start.year, period_start.month + 1, 1)
+    return period_start + timedelta(days=1)
+
+
+def daily_totals_query(metric: str, date_from: date, date_to: date):
+    """
+    Per-day booking counts or confirmed revenue for a date range
+    
+    Grouped in SQL: from the daily_stats rollup on SQLite, from the
+    booking_date index otherwise. Days without bookings are left out.
+    """
+    if engine.dialect.name == "sqlite":
+        if metric == "revenue":
+            value = DailyStats.confirmed_revenue
+        else:
+            value = DailyStats.booking_count
+        return (
+            select(DailyStats.day, func.sum(value))
+            .where(DailyStats.day >= date_from, DailyStats.day <= date_to)
+            .group_by(DailyStats.day)
+        )
+    
+    if metric == "revenue":
+        return (
+            select(Booking.booking_date, func.sum(Service.price))
+            .join(Service, Service.id == Booking.service_id)
+            .where(
+                Booking.booking_date >= date_from,
+                Booking.booking_date <= date_to,
+                Booking.status == "confirmed"
+            )
+            .group_by(Booking.booking_date)
+        )
+    return (
+        select(Booking.booking_date, func.count(Booking.id))
+        .where(Booking.booking_date >= date_from, Booking.booking_date <= date_to)
+        .group_by(Booking.booking_date)
+    )
+
+
+@router.get("/analytics/timeseries", response_model=TimeseriesResponse)
+async def get_analytics_timeseries(
+    metric: Literal["bookings", "revenue"] = Query("bookings"),
+    granularity: Literal["day", "week", "month"] = Query("day"),
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    session: Session = Depends(get_session),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Get bookings or revenue per day, week or month (Admin only)
+    
+    Every period in the range is listed, with 0 for periods without
+    bookings. Results are cached per (metric, granularity, range) and
+    dropped when bookings on a day inside the range change.
+    
+    - **metric**: bookings (all statuses, as counted by /admin/stats) or
+      revenue (confirmed bookings)
+    - **granularity**: day, week (starting Monday) or month; a period is
+      labelled by its first day and only counts days within the range
+    - **from**: First booking date included
+    - **to**: Last booking date included
+    """
+    validate_analytics_range(date_from, date_to)
+    
+    cache_key = (metric, granularity, date_from, date_to)
+    cached = analytics_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Every period in the range, so charts get explicit zeros
+    zero = 0.0 if metric == "revenue" else 0
+    values = {}
+    period_start = get_period_start(date_from, granularity)
+    while period_start <= date_to:
+        values[period_start] = zero
+        period_start = get_next_period_start(period_start, granularity)
+    
+    for day, value in session.exec(daily_totals_query(metric, date_from, date_to)):
+        values[get_period_start(day, granularity)] += value or 0
+    
+    response = TimeseriesResponse(
+        metric=metric,
+        granularity=granularity,
+        date_from=date_from,
+        date_to=date_to,
+        points=[
+            TimeseriesPoint(period_start=period_start, value=value)
+            for period_start, value in values.items()
+        ]
+    )
+    analytics_cache.set(cache_key, response)
+    
+    return response
+
+
+def minutes_of_day(column):
+    """SQL expression for a time column as minutes since midnight"""
+    return extract("hour", column) * 60 + extract("minute", column)
+
+
+@router.get("/analytics/utilization", response_model=UtilizationResponse)
+async def get_analytics_utilization(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    session: Session = Depends(get_session),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Get booked minutes vs available minutes per day (Admin only)
+    
+    Available minutes are the working hours of the day's availability
+    rules minus blocked periods; booked minutes count pending and confirmed
+    bookings. Utilization is booked / available, and can exceed 1 when
+    bookings were placed outside working hours.
+    
+    - **from**: First date of the report
+    - **to**: Last date of the report
+    """
+    validate_analytics_range(date_from, date_to)
+    
+    # Booked minutes per date, summed in SQL (a booking ending at midnight
+    # has an end time of 00:00)
+    start_minutes = minutes_of_day(Booking.start_time)
+    end_minutes = minutes_of_day(Booking.end_time)
+    duration = case(
+        (end_minutes < start_minutes, end_minutes + MINUTES_PER_DAY),
+        else_=end_minutes
+    ) - start_minutes
+    rows = session.exec(
+        select(Booking.booking_date, func.sum(duration))
+        .where(
+            Booking.booking_date >= date_from,
+            Booking.booking_date <= date_to,
+            Booking.status.in_(["pending", "confirmed"])
+        )
+        .group_by(Booking.booking_date)
+    ).all()
+    booked_dates = [booking_date for booking_date, _ in rows]
+    booked_totals = [minutes for _, minutes in rows]
+    
+    days = daily_utilization(
+        date_from,
+        date_to,
+        weekday_minutes(availability_template.get(session)),
+        booked_dates,
+        booked_totals
+    )
+    
+    total_available = sum(available for _, available, _, _ in days)
+    total_booked = sum(booked for _, _, booked, _ in days)
+    return UtilizationResponse(
+        date_from=date_from,
+        date_to=date_to,
+        available_minutes=total_available,
+        booked_minutes=total_booked,
+        utilization=round(total_booked / total_available, 4) if total_available else None,
+        days=[
+            UtilizationDay(
+                day=day,
+                available_minutes=available,
+                booked_minutes=booked,
+                utilization=utilization
+            )
+            for day, available, booked, utilization in days
+        ]
+    )
+
+
+@router.get("/metrics")
+async def get_metrics(
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Get in-process cache metrics (Admin only)
+    
+    Counters are per worker process and reset on restart
+    """
+    return {
+        "slot_cache": slot_cache.stats(),
+        "occupancy_cache": occupancy_cache.stats(),
+        "analytics_cache": analytics_cache.stats(),
+        "service_catalog": service_catalog.stats()
+    }
@@ -1,19 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlmodel import Session, select
-from typing import List
+from typing import Dict, List, Tuple
 from pydantic import BaseModel
 from datetime import date, time, datetime, timedelta
+from collections import defaultdict
 
+from app.core.availability_template import availability_template
+from app.core.cache import invalidate_slot_weekday, occupancy_cache, slot_cache
+from app.core.config import settings
 from app.core.database import get_session
+from app.core.holds import hold_store
+from app.core.serialization import fast_list_response, response_fields
+from app.core.service_catalog import service_catalog
+from app.core.slot_engine import DayOccupancy, Window, from_minutes, to_minutes
 from app.models.availability import Availability
 from app.models.booking import Booking
-from app.models.service import Service
 from app.models.user import User
 from app.api.deps import get_current_user, get_admin_user
 
 
 router = APIRouter()
 
+DEFAULT_SLOT_INTERVAL_MINUTES = 30
+
 
 # Request/Response Schemas
 class AvailabilityCreate(BaseModel):
@@ -56,6 +65,25 @@ class AvailableSlotsResponse(BaseModel):
     available_slots: List[TimeSlot]
 
 
+class AvailableSlotsRangeResponse(BaseModel):
+    """Schema for available slots over a date range"""
+    service_id: int
+    start: date
+    end: date
+    days: List[AvailableSlotsResponse]
+
+
+class NextAvailableSlotResponse(BaseModel):
+    """Schema for the earliest available slot"""
+    service_id: int
+    date: date
+    day_of_week: int
+    slot: TimeSlot
+
+
+AVAILABILITY_RESPONSE_FIELDS = response_fields(AvailabilityResponse)
+
+
 def get_day_of_week(target_date: date) -> int:
     """
     Get day of week for a date (0=Monday, 6=Sunday)
@@ -63,21 +91,136 @@ def get_day_of_week(target_date: date) -> int:
     return target_date.weekday()
 
 
+def get_booked_intervals_by_date(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    ignore_holds_of: int | None = None,
+    include_holds: bool = True
+) -> Dict[date, List[Tuple[time, time]]]:
+    """
+    Load pending/confirmed booking times for a date range in one query
+    
+    Active slot holds count as booked too, unless include_holds is False.
+    
+    Args:
+        session: Database session
+        start_date: First date of the range
+        end_date: Last date of the range, inclusive
+        ignore_holds_of: User whose own holds should not count as booked
+        include_holds: Whether to add active slot holds at all
+    
+    Returns:
+        Mapping of booking_date to (start_time, end_time) tuples
+    """
+    statement = select(Booking.booking_date, Booking.start_time, Booking.end_time).where(
+        Booking.booking_date >= start_date,
+        Booking.booking_date <= end_date,
+        Booking.status.in_(["pending", "confirmed"])
+    )
+    
+    intervals_by_date: Dict[date, List[Tuple[time, time]]] = defaultdict(list)
+    for booking_date, start_time, end_time in session.exec(statement):
+        intervals_by_date[booking_date].append((start_time, end_time))
+    
+    if not include_holds:
+        return intervals_by_date
+    
+    for hold in hold_store.between(start_date, end_date):
+        if hold.user_id != ignore_holds_of:
+            intervals_by_date[hold.booking_date].append((hold.start_time, hold.end_time))
+    
+    return intervals_by_date
+
+
+def build_day_occupancy(
+    windows: List[Window],
+    booked_intervals: List[Tuple[time, time]]
+) -> DayOccupancy:
+    """
+    Paint free windows and bookings for one day into an occupancy map
+    
+    Args:
+        windows: Free windows for the day from the availability template
+        booked_intervals: (start_time, end_time) of bookings and holds on that date
+    """
+    busy = [
+        (to_minutes(start_time), to_minutes(end_time, round_up=True))
+        for start_time, end_time in booked_intervals
+    ]
+    return DayOccupancy(windows, busy)
+
+
+def get_day_occupancies(
+    session: Session,
+    dates: List[date]
+) -> Dict[date, DayOccupancy]:
+    """
+    Get occupancy maps for a sorted list of dates
+    
+    Cached days are reused; the rest are built from the availability
+    template and a single booking query covering all of them. Days without
+    working hours never touch the booking table.
+    """
+    occupancies = {}
+    missing_dates = []
+    for target_date in dates:
+        occupancy = occupancy_cache.get(target_date)
+        if occupancy is None:
+            missing_dates.append(target_date)
+        else:
+            occupancies[target_date] = occupancy
+    
+    if not missing_dates:
+        return occupancies
+    
+    template = availability_template.get(session)
+    working_dates = [
+        target_date for target_date in missing_dates
+        if get_day_of_week(target_date) in template
+    ]
+    
+    booked_intervals = {}
+    if working_dates:
+        booked_intervals = get_booked_intervals_by_date(session, working_dates[0], working_dates[-1])
+    
+    for target_date in missing_dates:
+        occupancy = build_day_occupancy(
+            template.get(get_day_of_week(target_date), []),
+            booked_intervals.get(target_date, [])
+        )
+        occupancy_cache.set(target_date, occupancy)
+        occupancies[target_date] = occupancy
+    
+    return occupancies
+
+
+def slots_from_occupancy(
+    occupancy: DayOccupancy,
+    service_duration_minutes: int,
+    slot_interval_minutes: int = DEFAULT_SLOT_INTERVAL_MINUTES
+) -> List[TimeSlot]:
+    """Convert the free slots of an occupancy map into TimeSlot objects"""
+    return [
+        TimeSlot(start_time=from_minutes(start), end_time=from_minutes(end))
+        for start, end in occupancy.free_slots(service_duration_minutes, slot_interval_minutes)
+    ]
+
+
 def calculate_available_slots(
     session: Session,
     target_date: date,
     service_duration_minutes: int,
-    slot_interval_minutes: int = 30
+    slot_interval_minutes: int = DEFAULT_SLOT_INTERVAL_MINUTES
 ) -> List[TimeSlot]:
     """
     Calculate available time slots for a given date and service duration
     
     Algorithm:
-    1. Get working hours for the day of week
-    2. Exclude blocked times
-    3. Get all existing bookings for that date
-    4. Generate potential slots based on interval
-    5. Filter out slots that conflict with bookings or blocked times
+    1. Return the cached result if this date was computed before
+    2. Get the day's occupancy map, or build it from the compiled
+       availability template and the bookings for that date
+    3. Check each candidate slot against the map's prefix sums in O(1)
     
     Args:
         session: Database session
@@ -88,74 +231,24 @@ def calculate_available_slots(
     Returns:
         List of available TimeSlot objects
     """
-    day_of_week = get_day_of_week(target_date)
-    
-    # Get availability rules for this day
-    statement = select(Availability).where(
-        Availability.day_of_week == day_of_week
-    )
-    availability_rules = session.exec(statement).all()
+    hold_store.purge_expired()  # Drops cached slots for dates whose holds lapsed
     
-    if not availability_rules:
-        return []  # No working hours defined for this day
+    cache_key = (target_date, service_duration_minutes, slot_interval_minutes)
+    cached_slots = slot_cache.get(cache_key)
+    if cached_slots is not None:
+        return list(cached_slots)
     
-    # Get all confirmed/pending bookings for this date
-    booking_statement = select(Booking).where(
-        Booking.booking_date == target_date,
-        Booking.status.in_(["pending", "confirmed"])
-    )
-    existing_bookings = session.exec(booking_statement).all()
+    occupancy = get_day_occupancies(session, [target_date])[target_date]
+    slots = slots_from_occupancy(occupancy, service_duration_minutes, slot_interval_minutes)
+    slot_cache.set(cache_key, tuple(slots))
     
-    # Generate potential slots
-    available_slots = []
-    
-    for rule in availability_rules:
-        if rule.is_blocked:
-            continue  # Skip blocked time periods
-        
-        # Generate slots within this availability window
-        current_time = rule.start_time
-        rule_end = rule.end_time
-        
-        while True:
-            # Calculate end time for this slot
-            start_datetime = datetime.combine(target_date, current_time)
-            end_datetime = start_datetime + timedelta(minutes=service_duration_minutes)
-            
-            # Check if slot fits within availability window
-            if end_datetime.time() > rule_end:
-                break
-            
-            slot_end_time = end_datetime.time()
-            
-            # Check for conflicts with existing bookings
-            has_conflict = False
-            for booking in existing_bookings:
-                if (current_time < booking.end_time and slot_end_time > booking.start_time):
-                    has_conflict = True
-                    break
-            
-            # Check for conflicts with blocked times
-            for blocked_rule in availability_rules:
-                if blocked_rule.is_blocked:
-                    if (current_time < blocked_rule.end_time and slot_end_time > blocked_rule.start_time):
-                        has_conflict = True
-                        break
-            
-            if not has_conflict:
-                available_slots.append(TimeSlot(
-                    start_time=current_time,
-                    end_time=slot_end_time
-                ))
-            
-            # Move to next slot
-            next_datetime = start_datetime + timedelta(minutes=slot_interval_minutes)
-            current_time = next_datetime.time()
-            
-            if current_time >= rule_end:
-                break
-    
-    return available_slots
+    return slots
+
+
+def availability_changed(day_of_week: int) -> None:
+    """Rebuild the compiled template and drop cached slots for a weekday"""
+    availability_template.invalidate()
+    invalidate_slot_weekday(day_of_week)
 
 
 # ===== Availability Management Endpoints (Admin) =====
@@ -197,6 +290,8 @@ async def create_availability(
     session.commit()
     session.refresh(new_availability)
     
+    availability_changed(new_availability.day_of_week)
+    
     return new_availability
 
 
@@ -209,6 +304,10 @@ async def get_availability_rules(
     """
     statement = select(Availability)
     rules = session.exec(statement).all()
+    
+    if settings.FAST_JSON_RESPONSES:
+        return fast_list_response(rules, AVAILABILITY_RESPONSE_FIELDS)
+    
     return rules
 
 
@@ -248,6 +347,8 @@ async def update_availability_rule(
     session.commit()
     session.refresh(rule)
     
+    availability_changed(rule.day_of_week)
+    
     return rule
 
 
@@ -267,9 +368,12 @@ async def delete_availability_rule(
             detail="Availability rule not found"
         )
     
+    day_of_week = rule.day_of_week
     session.delete(rule)
     session.commit()
     
+    availability_changed(day_of_week)
+    
     return None
 
 
@@ -286,12 +390,12 @@ async def get_available_slots(
     
     This is the core availability algorithm that calculates free slots based on:
     - Working hours for the day
-    - Existing bookings
+    - Existing bookings and active slot holds
     - Blocked time periods
     - Service duration
     """
     # Get service
-    service = session.get(Service, service_id)
+    service = service_catalog.get(session, service_id)
     if not service or not service.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -310,3 +414,130 @@ async def get_available_slots(
         day_of_week=get_day_of_week(target_date),
         available_slots=slots
     )
+
+
+@router.get("/slots/range", response_model=AvailableSlotsRangeResponse)
+async def get_available_slots_range(
+    service_id: int = Query(..., description="Service ID to book"),
+    start: date = Query(..., description="First date of the range (YYYY-MM-DD)"),
+    end: date = Query(..., description="Last date of the range, inclusive (YYYY-MM-DD)"),
+    session: Session = Depends(get_session)
+):
+    """
+    Get available time slots for every date in a range (Public endpoint)
+    
+    Cached days are served from the slot and occupancy caches; bookings for
+    the remaining days are loaded with one query and combined with the
+    compiled availability template, so a whole week or month costs the
+    same queries as a single day.
+    """
+    if end < start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must not be before start"
+        )
+    
+    if (end - start).days + 1 > settings.MAX_SLOT_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {settings.MAX_SLOT_RANGE_DAYS} days"
+        )
+    
+    # Get service
+    service = service_catalog.get(session, service_id)
+    if not service or not service.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found or not available"
+        )
+    
+    dates = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    
+    # Serve cached days and compute the rest together
+    hold_store.purge_expired()
+    slots_by_date = {}
+    for current_date in dates:
+        cached_slots = slot_cache.get((current_date, service.duration_minutes, DEFAULT_SLOT_INTERVAL_MINUTES))
+        if cached_slots is not None:
+            slots_by_date[current_date] = list(cached_slots)
+    
+    missing_dates = [current_date for current_date in dates if current_date not in slots_by_date]
+    occupancies = get_day_occupancies(session, missing_dates)
+    for current_date in missing_dates:
+        slots = slots_from_occupancy(occupancies[current_date], service.duration_minutes)
+        slot_cache.set((current_date, service.duration_minutes, DEFAULT_SLOT_INTERVAL_MINUTES), tuple(slots))
+        slots_by_date[current_date] = slots
+    
+    days = [
+        AvailableSlotsResponse(
+            date=current_date,
+            day_of_week=get_day_of_week(current_date),
+            available_slots=slots_by_date[current_date]
+        )
+        for current_date in dates
+    ]
+    
+    return AvailableSlotsRangeResponse(
+        service_id=service_id,
+        start=start,
+        end=end,
+        days=days
+    )
+
+
+@router.get("/next", response_model=NextAvailableSlotResponse)
+async def get_next_available_slot(
+    service_id: int = Query(..., description="Service ID to book"),
+    after: datetime | None = Query(None, description="Earliest acceptable start (defaults to now)"),
+    horizon_days: int | None = Query(None, ge=1, description="Number of days to search"),
+    session: Session = Depends(get_session)
+):
+    """
+    Get the earliest available slot for a service (Public endpoint)
+    
+    Scans forward one day at a time and stops at the first free slot.
+    Weekdays without working hours are skipped using the compiled
+    availability template, without querying bookings.
+    
+    - **after**: Only slots starting at or after this moment are returned
+    - **horizon_days**: Days to search, capped by NEXT_SLOT_HORIZON_DAYS
+    """
+    service = service_catalog.get(session, service_id)
+    if not service or not service.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found or not available"
+        )
+    
+    if after is None:
+        after = datetime.now()
+    
+    horizon = min(horizon_days or settings.NEXT_SLOT_HORIZON_DAYS, settings.NEXT_SLOT_HORIZON_DAYS)
+    template = availability_template.get(session)
+    
+    for offset in range(horizon):
+        current_date = after.date() + timedelta(days=offset)
+        day_of_week = get_day_of_week(current_date)
+        if day_of_week not in template:
+            continue  # No working hours on this weekday
+        
+        slots = calculate_available_slots(
+            session=session,
+            target_date=current_date,
+            service_duration_minutes=service.duration_minutes
+        )
+        
+        for slot in slots:
+            if offset == 0 and slot.start_time < after.time():
+                continue
+            return NextAvailableSlotResponse(
+                service_id=service_id,
+                date=current_date,
+                day_of_week=day_of_week,
+                slot=slot
+            )
+    
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"No available slots in the next {horizon} days"
+    )
@@ -1,15 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlmodel import Session, select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select, update
+from typing import Dict, Iterator, List, Literal, Tuple
+from uuid import uuid4
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from pydantic import BaseModel
 from datetime import date, time, datetime, timedelta
+from collections import defaultdict
+from contextlib import contextmanager
 
-from app.core.database import get_session
-from app.core.email import send_booking_confirmation, send_status_update, send_cancellation_notice
+from app.core.cache import invalidate_booking_dates
+from app.core.config import settings
+from app.core.database import engine, get_session
+from app.core.email import (
+    send_booking_confirmation,
+    send_booking_confirmations,
+    send_status_update,
+    send_cancellation_notice,
+    send_cancellation_notices,
+    send_waitlist_offers
+)
+from app.core.holds import SlotHold, hold_store
+from app.core.serialization import fast_list_response, response_fields
+from app.core.service_catalog import service_catalog
 from app.models.booking import Booking
 from app.models.service import Service
 from app.models.user import User
-from app.api.deps import get_current_user, get_admin_user
+from app.models.waitlist import WaitlistEntry
+from app.api.deps import get_current_user, get_admin_user, parse_id_list
+from app.api.routes.availability import get_booked_intervals_by_date
 
 
 router = APIRouter()
@@ -40,39 +62,177 @@ class BookingResponse(BaseModel):
     end_time: time
     status: str
     created_at: datetime
+    series_id: str | None = None
     
     class Config:
         from_attributes = True
 
 
+class BulkBookingItem(BaseModel):
+    """Schema for one booking in a bulk request"""
+    service_id: int
+    booking_date: date
+    start_time: time
+    user_id: int | None = None  # Admins may book on behalf of another user
+
+
+class BulkBookingCreate(BaseModel):
+    """Schema for creating many bookings at once"""
+    items: List[BulkBookingItem]
+    mode: Literal["all_or_nothing", "best_effort"] = "all_or_nothing"
+
+
+class BulkBookingItemResult(BaseModel):
+    """Schema for the outcome of one bulk item"""
+    index: int
+    status: str  # created, conflict, invalid, skipped
+    detail: str | None = None
+    booking: BookingResponse | None = None
+
+
+class BulkBookingResponse(BaseModel):
+    """Schema for bulk booking response"""
+    mode: str
+    created: int
+    failed: int
+    results: List[BulkBookingItemResult]
+
+
+class SlotHoldCreate(BaseModel):
+    """Schema for holding a slot during checkout"""
+    service_id: int
+    booking_date: date
+    start_time: time
+    minutes: int | None = None  # Defaults to SLOT_HOLD_MINUTES
+
+
+class SlotHoldResponse(BaseModel):
+    """Schema for slot hold response"""
+    id: str
+    service_id: int
+    booking_date: date
+    start_time: time
+    end_time: time
+    expires_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class WaitlistCreate(BaseModel):
+    """Schema for joining the waitlist of a booked slot"""
+    service_id: int
+    booking_date: date
+    start_time: time
+
+
+class WaitlistEntryResponse(BaseModel):
+    """Schema for waitlist entry response"""
+    id: int
+    user_id: int
+    service_id: int
+    booking_date: date
+    start_time: time
+    end_time: time
+    status: str
+    hold_id: str | None = None
+    created_at: datetime
+    offered_at: datetime | None = None
+    
+    class Config:
+        from_attributes = True
+
+
+class BookingSeriesCreate(BaseModel):
+    """Schema for creating a recurring booking series"""
+    service_id: int
+    start_date: date
+    start_time: time
+    frequency: Literal["weekly", "biweekly"] = "weekly"
+    count: int | None = None  # Number of occurrences
+    end_date: date | None = None  # Last possible occurrence date (if no count)
+
+
+class BookingSeriesReschedule(BaseModel):
+    """Schema for moving every upcoming occurrence of a series"""
+    start_time: time | None = None
+    shift_days: int = 0  # Move each occurrence by this many days
+
+
+class BookingSeriesResponse(BaseModel):
+    """Schema for booking series response"""
+    series_id: str
+    bookings: List[BookingResponse]
+
+
+SERIES_STEP_DAYS = {"weekly": 7, "biweekly": 14}
+
+BOOKING_RESPONSE_FIELDS = response_fields(BookingResponse)
+
+
+def calculate_end_time(booking_date: date, start_time: time, duration_minutes: int) -> time:
+    """Get the end time of a booking from its start and the service duration"""
+    start_datetime = datetime.combine(booking_date, start_time)
+    return (start_datetime + timedelta(minutes=duration_minutes)).time()
+
+
 def check_booking_conflict(
     session: Session,
     booking_date: date,
     start_time: time,
     end_time: time,
-    exclude_booking_id: int | None = None
+    exclude_booking_id: int | None = None,
+    hold_user_id: int | None = None
 ) -> bool:
     """
     Check if there's a booking conflict for the given time slot
     
+    Active slot holds are checked first, in memory; holds owned by
+    hold_user_id do not count. The booking overlap test then runs as a
+    single EXISTS query answered from the
+    (booking_date, status, start_time, end_time) index, so no booking
+    rows are loaded.
+    
     Returns True if there's a conflict, False otherwise
     """
-    statement = select(Booking).where(
+    if hold_store.overlaps(booking_date, start_time, end_time, exclude_user_id=hold_user_id):
+        return True
+    
+    conditions = [
         Booking.booking_date == booking_date,
-        Booking.status != "cancelled"
-    )
+        Booking.status.in_(["pending", "confirmed"]),
+        Booking.start_time < end_time,
+        Booking.end_time > start_time
+    ]
     
     if exclude_booking_id:
-        statement = statement.where(Booking.id != exclude_booking_id)
-    
-    existing_bookings = session.exec(statement).all()
+        conditions.append(Booking.id != exclude_booking_id)
     
-    for booking in existing_bookings:
-        # Check for time overlap
-        if (start_time < booking.end_time and end_time > booking.start_time):
-            return True
+    return session.exec(select(select(Booking.id).where(*conditions).exists())).one()
+
+
+@contextmanager
+def reject_overlapping_writes(session: Session) -> Iterator[None]:
+    """
+    Report booking writes rejected by the overlap triggers as 409
     
-    return False
+    The triggers reject a write that slipped past the conflict check
+    because another worker process committed first.
+    """
+    try:
+        yield
+    except IntegrityError:
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot is already booked"
+        )
+
+
+def commit_booking_write(session: Session) -> None:
+    """Commit a booking insert/update, reporting overlaps as 409"""
+    with reject_overlapping_writes(session):
+        session.commit()
 
 
 @router.post("/", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
@@ -90,7 +250,7 @@ async def create_booking(
     - **start_time**: Start time of the booking
     """
     # Get service to calculate end time
-    service = session.get(Service, booking_data.service_id)
+    service = service_catalog.get(session, booking_data.service_id)
     if not service:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -104,12 +264,14 @@ async def create_booking(
         )
     
     # Calculate end time
-    start_datetime = datetime.combine(booking_data.booking_date, booking_data.start_time)
-    end_datetime = start_datetime + timedelta(minutes=service.duration_minutes)
-    end_time = end_datetime.time()
+    end_time = calculate_end_time(booking_data.booking_date, booking_data.start_time, service.duration_minutes)
     
-    # Check for conflicts
-    if check_booking_conflict(session, booking_data.booking_date, booking_data.start_time, end_time):
+    # Check for conflicts and insert with no await in between, so no other
+    # request in this process can take the slot between the two
+    if check_booking_conflict(
+        session, booking_data.booking_date, booking_data.start_time, end_time,
+        hold_user_id=current_user.id
+    ):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Time slot is already booked"
@@ -126,9 +288,12 @@ async def create_booking(
     )
     
     session.add(new_booking)
-    session.commit()
+    commit_booking_write(session)
+    
     session.refresh(new_booking)
     
+    invalidate_booking_dates(new_booking.booking_date)
+    
     # Send confirmation email in background
     background_tasks.add_task(
         send_booking_confirmation,
@@ -143,22 +308,973 @@ async def create_booking(
     return new_booking
 
 
+@router.post("/bulk", response_model=BulkBookingResponse, status_code=status.HTTP_201_CREATED)
+async def create_bookings_bulk(
+    bulk_data: BulkBookingCreate,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create many bookings in one transaction (Authenticated users)
+    
+    Every item is checked against existing bookings (one range query for
+    the whole batch) and against the other items in the batch, then all
+    accepted items are inserted with a single commit.
+    
+    - **items**: Bookings to create; admins may set **user_id** per item
+    - **mode**: all_or_nothing creates nothing if any item fails (409),
+      best_effort creates every item that passes
+    """
+    items = bulk_data.items
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one booking is required"
+        )
+    
+    if len(items) > settings.MAX_BULK_BOOKINGS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A bulk request can contain at most {settings.MAX_BULK_BOOKINGS} bookings"
+        )
+    
+    # Services come from the catalog; load every referenced user in one query
+    service_ids = {item.service_id for item in items}
+    services = service_catalog.get_many(session, list(service_ids))
+    user_ids = {item.user_id for item in items if item.user_id is not None} | {current_user.id}
+    users = {
+        user.id: user
+        for user in session.exec(select(User).where(User.id.in_(user_ids))).all()
+    }
+    
+    results: List[BulkBookingItemResult] = []
+    candidates = []  # (index, user, service, item, end_time)
+    for index, item in enumerate(items):
+        user_id = item.user_id if item.user_id is not None else current_user.id
+        service = services.get(item.service_id)
+        
+        detail = None
+        if user_id != current_user.id and current_user.role != "admin":
+            detail = "Only admins can book for other users"
+        elif user_id not in users:
+            detail = "User not found"
+        elif not service:
+            detail = "Service not found"
+        elif not service.is_active:
+            detail = "Service is not available"
+        
+        if detail:
+            results.append(BulkBookingItemResult(index=index, status="invalid", detail=detail))
+            continue
+        
+        end_time = calculate_end_time(item.booking_date, item.start_time, service.duration_minutes)
+        candidates.append((index, users[user_id], service, item, end_time))
+        results.append(BulkBookingItemResult(index=index, status="pending"))
+    
+    dates = sorted({item.booking_date for _, _, _, item, _ in candidates})
+    created = []  # (index, user, service, booking)
+    
+    # Existing bookings for every date in the batch, in one query. Holds are
+    # checked per item, since only the booked user's own holds may be ignored
+    taken = {}
+    holds_by_date = defaultdict(list)
+    if dates:
+        taken = get_booked_intervals_by_date(session, dates[0], dates[-1], include_holds=False)
+        for hold in hold_store.between(dates[0], dates[-1]):
+            holds_by_date[hold.booking_date].append(hold)
+    
+    for index, user, service, item, end_time in candidates:
+        day_taken = taken.setdefault(item.booking_date, [])
+        held = any(
+            item.start_time < hold.end_time and end_time > hold.start_time
+            for hold in holds_by_date[item.booking_date]
+            if hold.user_id != user.id
+        )
+        if held or any(item.start_time < taken_end and end_time > taken_start for taken_start, taken_end in day_taken):
+            results[index] = BulkBookingItemResult(
+                index=index, status="conflict", detail="Time slot is already booked"
+            )
+            continue
+        
+        # Later items in the batch must not overlap this one either
+        day_taken.append((item.start_time, end_time))
+        created.append((index, user, service, Booking(
+            user_id=user.id,
+            service_id=service.id,
+            booking_date=item.booking_date,
+            start_time=item.start_time,
+            end_time=end_time,
+            status="pending"
+        )))
+    
+    failed = len(items) - len(created)
+    if failed and bulk_data.mode == "all_or_nothing":
+        for index, _, _, _ in created:
+            results[index] = BulkBookingItemResult(
+                index=index, status="skipped", detail="Batch rejected"
+            )
+        response = BulkBookingResponse(
+            mode=bulk_data.mode, created=0, failed=failed, results=results
+        )
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content=jsonable_encoder(response)
+        )
+    
+    if created:
+        session.add_all([booking for _, _, _, booking in created])
+        session.flush()
+        for index, _, _, booking in created:
+            results[index] = BulkBookingItemResult(
+                index=index,
+                status="created",
+                booking=BookingResponse.model_validate(booking)
+            )
+        commit_booking_write(session)
+    
+    invalidate_booking_dates(*dates)
+    
+    # Queue all confirmation emails as one background task
+    if created:
+        background_tasks.add_task(
+            send_booking_confirmations,
+            [
+                {
+                    "user_email": user.email,
+                    "user_name": user.full_name,
+                    "service_name": service.name,
+                    "booking_date": str(booking.booking_date),
+                    "start_time": str(booking.start_time),
+                    "end_time": str(booking.end_time)
+                }
+                for _, user, service, booking in created
+            ]
+        )
+    
+    return BulkBookingResponse(
+        mode=bulk_data.mode,
+        created=len(created),
+        failed=failed,
+        results=results
+    )
+
+
+def get_own_hold(hold_id: str, current_user: User) -> SlotHold:
+    """Get an active hold owned by the current user or raise 404"""
+    hold = hold_store.get(hold_id)
+    if not hold or hold.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Hold not found or expired"
+        )
+    return hold
+
+
+def close_waitlist_offer(session: Session, hold_id: str, new_status: str) -> bool:
+    """
+    Move the waitlist entry offered a hold from "offered" to new_status
+    
+    The update only matches an entry that is still offered, so when
+    requests or workers race to close the same offer exactly one of them
+    wins. Returns True for the winner; the caller commits.
+    """
+    result = session.exec(
+        update(WaitlistEntry)
+        .where(WaitlistEntry.hold_id == hold_id, WaitlistEntry.status == "offered")
+        .values(status=new_status)
+    )
+    return result.rowcount > 0
+
+
+@router.post("/holds", response_model=SlotHoldResponse, status_code=status.HTTP_201_CREATED)
+async def create_slot_hold(
+    hold_data: SlotHoldCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Hold a slot for a few minutes while checking out (Authenticated users)
+    
+    A held slot is not offered to other users and cannot be booked by
+    them until the hold is confirmed, released or expires.
+    
+    - **service_id**: ID of the service to book
+    - **booking_date**: Date of the booking
+    - **start_time**: Start time of the booking
+    - **minutes**: Hold lifetime, capped by MAX_SLOT_HOLD_MINUTES
+    """
+    minutes = hold_data.minutes or settings.SLOT_HOLD_MINUTES
+    if minutes < 1 or minutes > settings.MAX_SLOT_HOLD_MINUTES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"minutes must be between 1 and {settings.MAX_SLOT_HOLD_MINUTES}"
+        )
+    
+    service = service_catalog.get(session, hold_data.service_id)
+    if not service:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found"
+        )
+    
+    if not service.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Service is not available"
+        )
+    
+    if hold_store.count_for_user(current_user.id) >= settings.MAX_HOLDS_PER_USER:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"You can hold at most {settings.MAX_HOLDS_PER_USER} slots at a time"
+        )
+    
+    end_time = calculate_end_time(hold_data.booking_date, hold_data.start_time, service.duration_minutes)
+    
+    # The user's own holds count too, so one user cannot stack holds on a slot
+    if check_booking_conflict(session, hold_data.booking_date, hold_data.start_time, end_time):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot is already booked"
+        )
+    
+    hold = hold_store.create(
+        user_id=current_user.id,
+        service_id=service.id,
+        booking_date=hold_data.booking_date,
+        start_time=hold_data.start_time,
+        end_time=end_time,
+        minutes=minutes
+    )
+    
+    return hold
+
+
+@router.post("/holds/{hold_id}/confirm", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
+async def confirm_slot_hold(
+    hold_id: str,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Turn a hold into a booking (Authenticated users)
+    
+    The slot was checked when the hold was created and nobody else could
+    take it since, so the booking is inserted without another conflict
+    check. The overlap triggers still guard against other processes. A
+    waitlist entry offered this hold is marked booked in the same
+    transaction.
+    """
+    hold = get_own_hold(hold_id, current_user)
+    
+    service = service_catalog.get(session, hold.service_id)
+    if not service or not service.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Service is not available"
+        )
+    
+    new_booking = Booking(
+        user_id=current_user.id,
+        service_id=hold.service_id,
+        booking_date=hold.booking_date,
+        start_time=hold.start_time,
+        end_time=hold.end_time,
+        status="pending"
+    )
+    
+    session.add(new_booking)
+    # Insert before closing the offer, so an overlap rejected by the
+    # triggers is reported as 409 and rolls both back
+    with reject_overlapping_writes(session):
+        session.flush()
+        close_waitlist_offer(session, hold_id, "booked")
+        session.commit()
+    hold_store.release(hold_id)
+    
+    session.refresh(new_booking)
+    
+    invalidate_booking_dates(new_booking.booking_date)
+    
+    # Send confirmation email in background
+    background_tasks.add_task(
+        send_booking_confirmation,
+        current_user.email,
+        current_user.full_name,
+        service.name,
+        str(new_booking.booking_date),
+        str(new_booking.start_time),
+        str(new_booking.end_time)
+    )
+    
+    return new_booking
+
+
+@router.delete("/holds/{hold_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def release_slot_hold(
+    hold_id: str,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Release a hold before it expires (Authenticated users)
+    
+    Releasing a waitlist offer declines it, and the slot is offered to
+    the next user waiting for it.
+    """
+    hold = get_own_hold(hold_id, current_user)
+    hold_store.release(hold_id)
+    
+    if close_waitlist_offer(session, hold_id, "expired"):
+        session.commit()
+        background_tasks.add_task(promote_waitlist, [(hold.booking_date, hold.start_time, hold.end_time)])
+    
+    return None
+
+
+async def promote_waitlist(freed_slots: List[Tuple[date, time, time]]) -> None:
+    """
+    Offer freed slots to the first eligible waitlisted users
+    
+    Runs as a background task after a cancellation. For each freed slot,
+    one range scan on the waitlist index finds the waiting entries that
+    overlap it, oldest first. Each entry whose slot is now entirely free
+    gets a hold for WAITLIST_OFFER_MINUTES and an email; the hold then
+    keeps later entries for the same time from being offered it too.
+    
+    Args:
+        freed_slots: (booking_date, start_time, end_time) of cancelled bookings
+    """
+    notifications = []
+    with Session(engine) as session:
+        for booking_date, start_time, end_time in freed_slots:
+            statement = (
+                select(WaitlistEntry, User, Service)
+                .join(User, User.id == WaitlistEntry.user_id)
+                .join(Service, Service.id == WaitlistEntry.service_id)
+                .where(
+                    WaitlistEntry.booking_date == booking_date,
+                    WaitlistEntry.start_time < end_time,
+                    WaitlistEntry.end_time > start_time,
+                    WaitlistEntry.status == "waiting"
+                )
+                .order_by(WaitlistEntry.created_at, WaitlistEntry.id)
+            )
+            for entry, user, service in session.exec(statement).all():
+                if not service.is_active or not user.is_active:
+                    continue
+                if check_booking_conflict(session, entry.booking_date, entry.start_time, entry.end_time):
+                    continue
+                
+                hold = hold_store.create(
+                    user_id=user.id,
+                    service_id=service.id,
+                    booking_date=entry.booking_date,
+                    start_time=entry.start_time,
+                    end_time=entry.end_time,
+                    minutes=settings.WAITLIST_OFFER_MINUTES
+                )
+                entry.status = "offered"
+                entry.hold_id = hold.id
+                entry.offered_at = datetime.utcnow()
+                session.add(entry)
+                notifications.append({
+                    "user_email": user.email,
+                    "user_name": user.full_name,
+                    "service_name": service.name,
+                    "booking_date": str(hold.booking_date),
+                    "start_time": str(hold.start_time),
+                    "end_time": str(hold.end_time),
+                    "hold_id": hold.id,
+                    "expires_at": hold.expires_at.strftime("%Y-%m-%d %H:%M")
+                })
+            session.commit()
+    
+    if notifications:
+        await send_waitlist_offers(notifications)
+
+
+async def expire_waitlist_offers() -> None:
+    """
+    Pass lapsed waitlist offers on to the next users waiting
+    
+    An offer not confirmed within WAITLIST_OFFER_MINUTES has lost its hold,
+    so its entry is marked expired and its slot promoted again. Runs every
+    WAITLIST_SWEEP_SECONDS from the app lifespan.
+    """
+    cutoff = datetime.utcnow() - timedelta(minutes=settings.WAITLIST_OFFER_MINUTES)
+    freed_slots = []
+    with Session(engine) as session:
+        lapsed = session.exec(
+            select(WaitlistEntry).where(
+                WaitlistEntry.status == "offered",
+                WaitlistEntry.offered_at <= cutoff
+            )
+        ).all()
+        for entry in lapsed:
+            if close_waitlist_offer(session, entry.hold_id, "expired"):
+                freed_slots.append((entry.booking_date, entry.start_time, entry.end_time))
+        session.commit()
+    
+    if freed_slots:
+        await promote_waitlist(freed_slots)
+
+
+@router.post("/waitlist", response_model=WaitlistEntryResponse, status_code=status.HTTP_201_CREATED)
+async def join_waitlist(
+    waitlist_data: WaitlistCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Wait for a booked slot to be freed (Authenticated users)
+    
+    When a booking overlapping the slot is cancelled, the first eligible
+    user on the waitlist gets a hold on it and an email with the hold ID
+    to confirm through POST /bookings/holds/{hold_id}/confirm.
+    
+    - **service_id**: ID of the service to book
+    - **booking_date**: Date of the booking
+    - **start_time**: Start time of the booking
+    """
+    service = service_catalog.get(session, waitlist_data.service_id)
+    if not service:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found"
+        )
+    
+    if not service.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Service is not available"
+        )
+    
+    end_time = calculate_end_time(waitlist_data.booking_date, waitlist_data.start_time, service.duration_minutes)
+    
+    if not check_booking_conflict(
+        session, waitlist_data.booking_date, waitlist_data.start_time, end_time,
+        hold_user_id=current_user.id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Time slot is not booked; book it directly"
+        )
+    
+    existing = session.exec(
+        select(WaitlistEntry.id).where(
+            WaitlistEntry.booking_date == waitlist_data.booking_date,
+            WaitlistEntry.start_time == waitlist_data.start_time,
+            WaitlistEntry.service_id == service.id,
+            WaitlistEntry.user_id == current_user.id,
+            WaitlistEntry.status == "waiting"
+        )
+    ).first()
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Already on the waitlist for this slot"
+        )
+    
+    entry = WaitlistEntry(
+        user_id=current_user.id,
+        service_id=service.id,
+        booking_date=waitlist_data.booking_date,
+        start_time=waitlist_data.start_time,
+        end_time=end_time
+    )
+    
+    session.add(entry)
+    session.commit()
+    session.refresh(entry)
+    
+    return entry
+
+
+@router.get("/waitlist", response_model=List[WaitlistEntryResponse])
+async def get_waitlist_entries(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the current user's waiting and offered waitlist entries
+    """
+    statement = select(WaitlistEntry).where(
+        WaitlistEntry.user_id == current_user.id,
+        WaitlistEntry.status.in_(["waiting", "offered"])
+    ).order_by(WaitlistEntry.booking_date, WaitlistEntry.start_time)
+    
+    return session.exec(statement).all()
+
+
+@router.delete("/waitlist/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def leave_waitlist(
+    entry_id: int,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Leave the waitlist for a slot
+    
+    Leaving with an open offer declines it: the offer's hold is released
+    and the slot is offered to the next user waiting for it.
+    """
+    entry = session.get(WaitlistEntry, entry_id)
+    if not entry or entry.status == "removed":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Waitlist entry not found"
+        )
+    
+    if current_user.role != "admin" and entry.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to remove this waitlist entry"
+        )
+    
+    if entry.status == "offered":
+        freed_slot = (entry.booking_date, entry.start_time, entry.end_time)
+        if close_waitlist_offer(session, entry.hold_id, "removed"):
+            hold_store.release(entry.hold_id)
+            background_tasks.add_task(promote_waitlist, [freed_slot])
+    else:
+        entry.status = "removed"
+        session.add(entry)
+    session.commit()
+    
+    return None
+
+
+def find_interval_conflicts(
+    taken: Dict[date, List[Tuple[time, time]]],
+    occurrences: List[Tuple[date, time, time]]
+) -> List[date]:
+    """Dates of occurrences that overlap an already taken interval"""
+    return [
+        occurrence_date
+        for occurrence_date, start_time, end_time in occurrences
+        if any(
+            start_time < taken_end and end_time > taken_start
+            for taken_start, taken_end in taken.get(occurrence_date, [])
+        )
+    ]
+
+
+def get_series_bookings(
+    session: Session,
+    series_id: str,
+    current_user: User,
+    upcoming_only: bool = False
+) -> List[Booking]:
+    """
+    Load a series' bookings in date order, enforcing ownership
+    
+    With upcoming_only, only pending and confirmed bookings from today on
+    are returned: the occurrences that still hold a slot.
+    
+    Raises:
+        HTTPException: 404 if the series does not exist, 403 if it belongs to another user
+    """
+    statement = select(Booking).where(Booking.series_id == series_id).order_by(Booking.booking_date)
+    bookings = session.exec(statement).all()
+    if not bookings:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking series not found"
+        )
+    
+    if current_user.role != "admin" and bookings[0].user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this booking series"
+        )
+    
+    if upcoming_only:
+        today = date.today()
+        bookings = [
+            booking for booking in bookings
+            if booking.status in ("pending", "confirmed") and booking.booking_date >= today
+        ]
+    
+    return bookings
+
+
+@router.post("/series", response_model=BookingSeriesResponse, status_code=status.HTTP_201_CREATED)
+async def create_booking_series(
+    series_data: BookingSeriesCreate,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create a recurring booking series (Authenticated users)
+    
+    Occurrences are expanded from **start_date** every week or every other
+    week, for **count** occurrences or until **end_date**. All of them are
+    checked against existing bookings with one range query and inserted in
+    a single transaction; if any occurrence conflicts, nothing is booked.
+    """
+    service = service_catalog.get(session, series_data.service_id)
+    if not service:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found"
+        )
+    
+    if not service.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Service is not available"
+        )
+    
+    if (series_data.count is None) == (series_data.end_date is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide exactly one of count or end_date"
+        )
+    
+    # Expand occurrences
+    step = timedelta(days=SERIES_STEP_DAYS[series_data.frequency])
+    occurrence_dates = []
+    current_date = series_data.start_date
+    while len(occurrence_dates) < settings.MAX_SERIES_OCCURRENCES + 1:
+        if series_data.count is not None and len(occurrence_dates) >= series_data.count:
+            break
+        if series_data.end_date is not None and current_date > series_data.end_date:
+            break
+        occurrence_dates.append(current_date)
+        current_date += step
+    
+    if not occurrence_dates:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Series has no occurrences"
+        )
+    
+    if len(occurrence_dates) > settings.MAX_SERIES_OCCURRENCES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A series can have at most {settings.MAX_SERIES_OCCURRENCES} occurrences"
+        )
+    
+    end_time = calculate_end_time(series_data.start_date, series_data.start_time, service.duration_minutes)
+    occurrences = [(occurrence_date, series_data.start_time, end_time) for occurrence_date in occurrence_dates]
+    series_id = uuid4().hex
+    
+    # Every occurrence against existing bookings, in one range query; series
+    # are always booked for the caller, so only the caller's holds are ignored
+    taken = get_booked_intervals_by_date(
+        session, occurrence_dates[0], occurrence_dates[-1], ignore_holds_of=current_user.id
+    )
+    conflicts = find_interval_conflicts(taken, occurrences)
+    if conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Time slot is already booked on: {', '.join(str(d) for d in conflicts)}"
+        )
+    
+    bookings = [
+        Booking(
+            user_id=current_user.id,
+            service_id=service.id,
+            booking_date=occurrence_date,
+            start_time=start_time,
+            end_time=occurrence_end,
+            status="pending",
+            series_id=series_id
+        )
+        for occurrence_date, start_time, occurrence_end in occurrences
+    ]
+    session.add_all(bookings)
+    session.flush()
+    response = BookingSeriesResponse(
+        series_id=series_id,
+        bookings=[BookingResponse.model_validate(booking) for booking in bookings]
+    )
+    commit_booking_write(session)
+    
+    invalidate_booking_dates(*occurrence_dates)
+    
+    background_tasks.add_task(
+        send_booking_confirmations,
+        [
+            {
+                "user_email": current_user.email,
+                "user_name": current_user.full_name,
+                "service_name": service.name,
+                "booking_date": str(booking.booking_date),
+                "start_time": str(booking.start_time),
+                "end_time": str(booking.end_time)
+            }
+            for booking in response.bookings
+        ]
+    )
+    
+    return response
+
+
+@router.get("/series/{series_id}", response_model=BookingSeriesResponse)
+async def get_booking_series(
+    series_id: str,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get every booking in a series
+    """
+    bookings = get_series_bookings(session, series_id, current_user)
+    return BookingSeriesResponse(series_id=series_id, bookings=bookings)
+
+
+@router.put("/series/{series_id}", response_model=BookingSeriesResponse)
+async def reschedule_booking_series(
+    series_id: str,
+    reschedule_data: BookingSeriesReschedule,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Reschedule every upcoming occurrence of a series in one transaction
+    
+    - **start_time**: New start time for each occurrence
+    - **shift_days**: Move each occurrence by this many days
+    
+    If any moved occurrence would conflict, nothing is changed. The
+    vacated slots are offered to waitlisted users.
+    """
+    bookings = get_series_bookings(session, series_id, current_user, upcoming_only=True)
+    if not bookings:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Series has no upcoming bookings"
+        )
+    
+    service = service_catalog.get(session, bookings[0].service_id)
+    shift = timedelta(days=reschedule_data.shift_days)
+    new_start = reschedule_data.start_time
+    
+    moves = []  # (booking, new date, new start, new end)
+    for booking in bookings:
+        new_date = booking.booking_date + shift
+        start_time = new_start or booking.start_time
+        moves.append((booking, new_date, start_time, calculate_end_time(new_date, start_time, service.duration_minutes)))
+    
+    old_slots = [(booking.booking_date, booking.start_time, booking.end_time) for booking in bookings]
+    old_dates = [booking.booking_date for booking in bookings]
+    new_dates = [new_date for _, new_date, _, _ in moves]
+    all_dates = sorted(set(old_dates) | set(new_dates))
+    
+    taken = get_booked_intervals_by_date(
+        session, all_dates[0], all_dates[-1], ignore_holds_of=bookings[0].user_id
+    )
+    
+    # The series' own current slots are being vacated
+    for booking in bookings:
+        taken[booking.booking_date].remove((booking.start_time, booking.end_time))
+    
+    conflicts = find_interval_conflicts(
+        taken, [(new_date, start_time, end_time) for _, new_date, start_time, end_time in moves]
+    )
+    if conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Time slot is already booked on: {', '.join(str(d) for d in conflicts)}"
+        )
+    
+    # Write moves one at a time, latest first when moving forward, so no
+    # occurrence lands on a slot its sibling has not vacated yet
+    moves.sort(key=lambda move: move[1], reverse=reschedule_data.shift_days > 0)
+    with reject_overlapping_writes(session):
+        for booking, new_date, start_time, end_time in moves:
+            booking.booking_date = new_date
+            booking.start_time = start_time
+            booking.end_time = end_time
+            session.add(booking)
+            session.flush()
+        session.commit()
+    
+    invalidate_booking_dates(*all_dates)
+    
+    background_tasks.add_task(promote_waitlist, old_slots)
+    
+    return BookingSeriesResponse(
+        series_id=series_id,
+        bookings=get_series_bookings(session, series_id, current_user)
+    )
+
+
+@router.delete("/series/{series_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_booking_series(
+    series_id: str,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Cancel every upcoming occurrence of a series in one transaction
+    """
+    bookings = get_series_bookings(session, series_id, current_user, upcoming_only=True)
+    
+    for booking in bookings:
+        booking.status = "cancelled"
+        session.add(booking)
+    session.commit()
+    
+    cancelled_dates = [booking.booking_date for booking in bookings]
+    invalidate_booking_dates(*cancelled_dates)
+    
+    if bookings:
+        background_tasks.add_task(
+            promote_waitlist,
+            [(booking.booking_date, booking.start_time, booking.end_time) for booking in bookings]
+        )
+        user = session.get(User, bookings[0].user_id)
+        service = service_catalog.get(session, bookings[0].service_id)
+        background_tasks.add_task(
+            send_cancellation_notices,
+            [
+                {
+                    "user_email": user.email,
+                    "user_name": user.full_name,
+                    "service_name": service.name,
+                    "booking_date": str(booking.booking_date),
+                    "start_time": str(booking.start_time)
+                }
+                for booking in bookings
+            ]
+        )
+    
+    return None
+
+
+def encode_booking_cursor(booking: Booking) -> str:
+    """Opaque cursor pointing just after a booking in (date, start, id) order"""
+    key = f"{booking.booking_date.isoformat()}|{booking.start_time.isoformat()}|{booking.id}"
+    return urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_booking_cursor(cursor: str) -> Tuple[date, time, int]:
+    """Parse a cursor from encode_booking_cursor or raise 400"""
+    try:
+        key = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        booking_date, start_time, booking_id = key.split("|")
+        return date.fromisoformat(booking_date), time.fromisoformat(start_time), int(booking_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def get_bookings_by_ids(session: Session, booking_ids: List[int], current_user: User) -> List[Booking]:
+    """
+    Load bookings by id with one IN query, in the requested order
+    
+    Applies get_booking's rules to every row: 404 if any id does not
+    exist, 403 if any booking belongs to another user (unless admin).
+    """
+    bookings = {
+        booking.id: booking
+        for booking in session.exec(select(Booking).where(Booking.id.in_(booking_ids))).all()
+    }
+    
+    missing = [booking_id for booking_id in booking_ids if booking_id not in bookings]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Bookings not found: {', '.join(str(booking_id) for booking_id in missing)}"
+        )
+    
+    if current_user.role != "admin":
+        forbidden = [booking.id for booking in bookings.values() if booking.user_id != current_user.id]
+        if forbidden:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Not authorized to view bookings: {', '.join(str(booking_id) for booking_id in sorted(forbidden))}"
+            )
+    
+    return [bookings[booking_id] for booking_id in booking_ids]
+
+
 @router.get("/", response_model=List[BookingResponse])
 async def get_bookings(
+    response: Response,
+    ids: str | None = Query(None, description="Comma-separated booking ids to fetch; other parameters are ignored"),
+    status_filter: str | None = Query(None, alias="status", description="Only bookings with this status"),
+    service_id: int | None = Query(None, description="Only bookings for this service"),
+    user_id: int | None = Query(None, description="Only bookings of this user (admins)"),
+    date_from: date | None = Query(None, description="Earliest booking date, inclusive"),
+    date_to: date | None = Query(None, description="Latest booking date, inclusive"),
+    cursor: str | None = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(settings.BOOKINGS_PAGE_SIZE, ge=1, le=settings.MAX_BOOKINGS_PAGE_SIZE),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all bookings for current user
+    Get a page of bookings for current user
+    
+    Admins can see all bookings, customers see only their own. Bookings
+    are ordered by (booking_date, start_time, id). When more bookings
+    follow, the X-Next-Cursor response header holds the cursor for the
+    next page. Pages seek straight to the cursor through the index that
+    matches the filters, so deep pages cost the same as the first.
     
-    Admins can see all bookings, customers see only their own
+    With **ids**, exactly those bookings are returned in the given order,
+    checked like GET /bookings/{id}.
     """
-    statement = select(Booking)
+    if ids is not None:
+        bookings = get_bookings_by_ids(session, parse_id_list(ids), current_user)
+        if settings.FAST_JSON_RESPONSES:
+            return fast_list_response(bookings, BOOKING_RESPONSE_FIELDS)
+        return bookings
     
     if current_user.role != "admin":
-        statement = statement.where(Booking.user_id == current_user.id)
+        if user_id is not None and user_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to view other users' bookings"
+            )
+        user_id = current_user.id
     
+    conditions = []
+    if user_id is not None:
+        conditions.append(Booking.user_id == user_id)
+    if service_id is not None:
+        conditions.append(Booking.service_id == service_id)
+    if status_filter is not None:
+        conditions.append(Booking.status == status_filter)
+    if date_from is not None:
+        conditions.append(Booking.booking_date >= date_from)
+    if date_to is not None:
+        conditions.append(Booking.booking_date <= date_to)
+    if cursor is not None:
+        conditions.append(
+            tuple_(Booking.booking_date, Booking.start_time, Booking.id) > tuple_(*decode_booking_cursor(cursor))
+        )
+    
+    statement = (
+        select(Booking)
+        .where(*conditions)
+        .order_by(Booking.booking_date, Booking.start_time, Booking.id)
+        .limit(limit + 1)
+    )
     bookings = session.exec(statement).all()
+    
+    page_headers = {}
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        page_headers["X-Next-Cursor"] = encode_booking_cursor(bookings[-1])
+    
+    if settings.FAST_JSON_RESPONSES:
+        return fast_list_response(bookings, BOOKING_RESPONSE_FIELDS, headers=page_headers)
+    
+    response.headers.update(page_headers)
+    
     return bookings
 
 
@@ -225,42 +1341,60 @@ async def update_booking(
     
     # Store old status for email notification
     old_status = booking.status
+    old_date = booking.booking_date
+    old_start, old_end = booking.start_time, booking.end_time
     
     # Update fields
     update_data = booking_data.model_dump(exclude_unset=True)
     
-    # If time or date changed, recalculate end_time and check conflicts
-    if "booking_date" in update_data or "start_time" in update_data:
-        new_date = update_data.get("booking_date", booking.booking_date)
+    new_date = update_data.get("booking_date", booking.booking_date)
+    
+    # If time or date changed, recalculate end_time
+    moved = "booking_date" in update_data or "start_time" in update_data
+    new_start, new_end = booking.start_time, booking.end_time
+    if moved:
         new_start = update_data.get("start_time", booking.start_time)
         
         # Get service to calculate end time
-        service = session.get(Service, booking.service_id)
-        start_datetime = datetime.combine(new_date, new_start)
-        end_datetime = start_datetime + timedelta(minutes=service.duration_minutes)
-        new_end = end_datetime.time()
-        
-        # Check for conflicts (excluding current booking)
-        if check_booking_conflict(session, new_date, new_start, new_end, exclude_booking_id=booking_id):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Time slot is already booked"
-            )
-        
+        service = service_catalog.get(session, booking.service_id)
+        new_end = calculate_end_time(new_date, new_start, service.duration_minutes)
         update_data["end_time"] = new_end
     
+    # A moved booking, or one taken out of cancelled, must not take a slot
+    # that is held or booked (excluding the current booking)
+    reactivated = old_status == "cancelled" and update_data.get("status", old_status) != "cancelled"
+    if (moved or reactivated) and check_booking_conflict(
+        session, new_date, new_start, new_end,
+        exclude_booking_id=booking_id, hold_user_id=booking.user_id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot is already booked"
+        )
+    
     for key, value in update_data.items():
         setattr(booking, key, value)
     
     session.add(booking)
-    session.commit()
+    commit_booking_write(session)
+    
     session.refresh(booking)
     
+    invalidate_booking_dates(old_date, booking.booking_date)
+    
+    # A cancelled or moved booking frees its old slot for the waitlist
+    old_slot = (old_date, old_start, old_end)
+    if old_status != "cancelled" and (
+        booking.status == "cancelled"
+        or old_slot != (booking.booking_date, booking.start_time, booking.end_time)
+    ):
+        background_tasks.add_task(promote_waitlist, [old_slot])
+    
     # Send status update email if status changed
     if "status" in update_data and update_data["status"] != old_status:
         # Get user and service info for email
         user = session.get(User, booking.user_id)
-        service = session.get(Service, booking.service_id)
+        service = service_catalog.get(session, booking.service_id)
         
         background_tasks.add_task(
             send_status_update,
@@ -300,13 +1434,22 @@ async def cancel_booking(
             detail="Not authorized to cancel this booking"
         )
     
+    was_active = booking.status != "cancelled"
     booking.status = "cancelled"
     session.add(booking)
     session.commit()
     
+    invalidate_booking_dates(booking.booking_date)
+    
+    if was_active:
+        background_tasks.add_task(
+            promote_waitlist,
+            [(booking.booking_date, booking.start_time, booking.end_time)]
+        )
+    
     # Send cancellation email
     user = session.get(User, booking.user_id)
-    service = session.get(Service, booking.service_id)
+    service = service_catalog.get(session, booking.service_id)
     
     background_tasks.add_task(
         send_cancellation_notice,
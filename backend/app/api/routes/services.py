@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from sqlmodel import Session, text
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+import re
 
-from app.core.database import get_session
+from app.core.cache import analytics_cache
+from app.core.config import settings
+from app.core.database import engine, get_session
+from app.core.serialization import fast_list_response, response_fields
+from app.core.service_catalog import service_catalog
 from app.models.service import Service
 from app.models.user import User
-from app.api.deps import get_current_user, get_admin_user
+from app.api.deps import get_current_user, get_admin_user, parse_id_list
 
 
 router = APIRouter()
@@ -43,24 +49,118 @@ class ServiceResponse(BaseModel):
         from_attributes = True
 
 
+service_list_adapter = TypeAdapter(List[ServiceResponse])
+
+SERVICE_RESPONSE_FIELDS = response_fields(ServiceResponse)
+
+
+def encode_services(services: List[Service]) -> bytes:
+    """Serialize services exactly as the ServiceResponse list endpoint would"""
+    return service_list_adapter.dump_json(
+        [ServiceResponse.model_validate(service) for service in services]
+    )
+
+
 @router.get("/", response_model=List[ServiceResponse])
 async def get_all_services(
     session: Session = Depends(get_session),
-    active_only: bool = True
+    active_only: bool = True,
+    ids: str | None = Query(None, description="Comma-separated service ids to fetch")
 ):
     """
     Get all services (public endpoint)
     
+    Served from the in-memory service catalog; the active list is
+    returned pre-serialized.
+    
     - **active_only**: If True, only return active services
+    - **ids**: Return exactly these services (active or not) in the given
+      order, or 404 if any does not exist
     """
-    statement = select(Service)
+    if ids is not None:
+        service_ids = parse_id_list(ids)
+        services = service_catalog.get_many(session, service_ids)
+        missing = [service_id for service_id in service_ids if service_id not in services]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Services not found: {', '.join(str(service_id) for service_id in missing)}"
+            )
+        return [services[service_id] for service_id in service_ids]
+    
     if active_only:
-        statement = statement.where(Service.is_active == True)
+        return Response(
+            content=service_catalog.active_json(session, encode_services),
+            media_type="application/json"
+        )
+    
+    services = service_catalog.all(session)
+    if settings.FAST_JSON_RESPONSES:
+        return fast_list_response(services, SERVICE_RESPONSE_FIELDS)
     
-    services = session.exec(statement).all()
     return services
 
 
+def build_fts_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 MATCH expression
+    
+    Every word must match, as a prefix so partial words typed into a
+    search box still find results. Words are quoted so FTS5 operators in
+    user input are treated as plain text.
+    """
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", query))
+
+
+@router.get("/search", response_model=List[ServiceResponse])
+async def search_services(
+    q: str = Query(..., min_length=1, description="Words to search for in service names and descriptions"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    session: Session = Depends(get_session)
+):
+    """
+    Search active services by name and description (public endpoint)
+    
+    Results are ranked by bm25 from the service_fts full-text index, with
+    matches in the name weighted above matches in the description.
+    
+    - **q**: Search words; every word must match (as a prefix)
+    - **limit**: Page size
+    - **offset**: Number of results to skip
+    """
+    match = build_fts_query(q)
+    if not match:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query must contain at least one word"
+        )
+    
+    if engine.dialect.name != "sqlite":
+        # No FTS5 index outside SQLite; fall back to substring matching
+        words = [word.lower() for word in re.findall(r"\w+", q)]
+        matches = [
+            service for service in service_catalog.all(session, active_only=True)
+            if all(word in f"{service.name} {service.description or ''}".lower() for word in words)
+        ]
+        return matches[offset:offset + limit]
+    
+    statement = text(
+        """
+        SELECT service.id
+        FROM service_fts
+        JOIN service ON service.id = service_fts.rowid
+        WHERE service_fts MATCH :match AND service.is_active
+        ORDER BY bm25(service_fts, 10.0, 1.0), service.id
+        LIMIT :limit OFFSET :offset
+        """
+    ).bindparams(match=match, limit=limit, offset=offset)
+    service_ids = [service_id for service_id, in session.exec(statement)]
+    
+    services = [service_catalog.get(session, service_id) for service_id in service_ids]
+    return [service for service in services if service is not None]
+
+
 @router.get("/{service_id}", response_model=ServiceResponse)
 async def get_service(
     service_id: int,
@@ -69,7 +169,7 @@ async def get_service(
     """
     Get a specific service by ID
     """
-    service = session.get(Service, service_id)
+    service = service_catalog.get(session, service_id)
     if not service:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -103,6 +203,8 @@ async def create_service(
     session.commit()
     session.refresh(new_service)
     
+    service_catalog.refresh(session)
+    
     return new_service
 
 
@@ -132,6 +234,12 @@ async def update_service(
     session.commit()
     session.refresh(service)
     
+    service_catalog.refresh(session)
+    
+    if "price" in update_data:
+        # Cached revenue series were computed with the old price
+        analytics_cache.invalidate_where(lambda key: key[0] == "revenue")
+    
     return service
 
 
@@ -158,4 +266,6 @@ async def delete_service(
     session.add(service)
     session.commit()
     
+    service_catalog.refresh(session)
+    
     return None
@@ -0,0 +1,90 @@
+"""
+Compiled weekly availability template
+
+Availability rules change rarely but are read on every slot request. The
+template compiles them once into, per weekday, a sorted list of free
+windows: overlapping working rules are merged and blocked periods are
+already subtracted. It is rebuilt lazily after any rule write in this
+process and after AVAILABILITY_TEMPLATE_TTL_SECONDS, to pick up rule
+writes from other workers.
+"""
+from collections import defaultdict
+from threading import Lock
+from time import monotonic
+from typing import Dict, Iterable, List, Optional
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.slot_engine import Window, merge_intervals, subtract_intervals, to_minutes
+from app.models.availability import Availability
+
+
+def compile_rules(rules: Iterable[Availability]) -> Dict[int, List[Window]]:
+    """
+    Compile availability rules into free windows per day of week
+
+    Each window keeps the start of the working period it came from as its
+    anchor, so slot start times stay on the same grid after a blocked
+    period is cut out of the middle of a working day.
+    """
+    working = defaultdict(list)
+    blocked = defaultdict(list)
+    for rule in rules:
+        if rule.is_blocked:
+            blocked[rule.day_of_week].append(
+                (to_minutes(rule.start_time), to_minutes(rule.end_time, round_up=True))
+            )
+        else:
+            working[rule.day_of_week].append(
+                (to_minutes(rule.start_time, round_up=True), to_minutes(rule.end_time))
+            )
+
+    template: Dict[int, List[Window]] = {}
+    for day_of_week, intervals in working.items():
+        removed = merge_intervals(blocked.get(day_of_week, []))
+        windows = []
+        for period_start, period_end in merge_intervals(intervals):
+            for start, end in subtract_intervals([(period_start, period_end)], removed):
+                windows.append((start, end, period_start))
+        if windows:
+            template[day_of_week] = windows
+    return template
+
+
+class AvailabilityTemplate:
+    """Process-local compiled view of the Availability table"""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._template: Optional[Dict[int, List[Window]]] = None
+        self._compiled_at: Optional[float] = None
+        self._lock = Lock()
+
+    def _is_stale(self) -> bool:
+        compiled_at = self._compiled_at
+        return (
+            self._template is None
+            or compiled_at is None
+            or monotonic() - compiled_at > self.ttl_seconds
+        )
+
+    def get(self, session: Session) -> Dict[int, List[Window]]:
+        """Return free windows for every weekday, compiling on first use or expiry"""
+        template = self._template
+        if self._is_stale():
+            with self._lock:
+                if self._is_stale():
+                    self._template = compile_rules(session.exec(select(Availability)).all())
+                    self._compiled_at = monotonic()
+                template = self._template
+        return template
+
+    def invalidate(self) -> None:
+        """Force a rebuild on next access (call after any rule write)"""
+        with self._lock:
+            self._template = None
+            self._compiled_at = None
+
+
+availability_template = AvailabilityTemplate(ttl_seconds=settings.AVAILABILITY_TEMPLATE_TTL_SECONDS)
@@ -0,0 +1,128 @@
+"""
+In-process caches
+
+LRUCache is a small thread-safe LRU map with a size bound, an optional
+time-to-live and hit/miss counters. Module-level instances are shared by
+the API routes. Each process keeps its own copy: the routes that write the
+underlying rows invalidate entries in their own process, and the TTL
+bounds how long other worker processes keep serving the old values.
+"""
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable
+
+from app.core.config import settings
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with a TTL and hit/miss counters"""
+
+    def __init__(self, maxsize: int, ttl_seconds: float = 0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds  # 0 keeps entries until evicted or invalidated
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, expires_at or None)
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss or expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if self.maxsize <= 0:
+            return
+        expires_at = monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches predicate, returning the count"""
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "expirations": self.expirations,
+        }
+
+
+# Available slots keyed by (date, service duration, slot interval)
+slot_cache = LRUCache(maxsize=settings.SLOT_CACHE_SIZE, ttl_seconds=settings.SLOT_CACHE_TTL_SECONDS)
+
+# Per-minute DayOccupancy maps keyed by date, shared by every service duration
+occupancy_cache = LRUCache(maxsize=settings.OCCUPANCY_CACHE_SIZE, ttl_seconds=settings.SLOT_CACHE_TTL_SECONDS)
+
+# Admin time series keyed by (metric, granularity, first date, last date)
+analytics_cache = LRUCache(maxsize=settings.ANALYTICS_CACHE_SIZE, ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS)
+
+
+def invalidate_slot_dates(*dates: date) -> None:
+    """Drop cached slots for the given dates (call after booking writes)"""
+    targets = set(dates)
+    slot_cache.invalidate_where(lambda key: key[0] in targets)
+    occupancy_cache.invalidate_where(lambda key: key in targets)
+
+
+def invalidate_slot_weekday(day_of_week: int) -> None:
+    """Drop cached slots for every date on a weekday (call after rule writes)"""
+    slot_cache.invalidate_where(lambda key: key[0].weekday() == day_of_week)
+    occupancy_cache.invalidate_where(lambda key: key.weekday() == day_of_week)
+
+
+def invalidate_analytics_dates(*dates: date) -> None:
+    """Drop cached time series whose date range covers any of the given dates"""
+    targets = set(dates)
+    analytics_cache.invalidate_where(
+        lambda key: any(key[2] <= target <= key[3] for target in targets)
+    )
+
+
+def invalidate_booking_dates(*dates: date) -> None:
+    """Drop every cache derived from the bookings on the given dates (call after booking writes)"""
+    invalidate_slot_dates(*dates)
+    invalidate_analytics_dates(*dates)
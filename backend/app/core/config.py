@@ -12,6 +12,41 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./app.db"
+    MAX_BULK_BOOKINGS: int = 100  # Largest batch accepted by POST /bookings/bulk
+    MAX_BULK_STATUS_UPDATES: int = 500  # Most bookings in one POST /admin/bookings/status
+    BOOKINGS_PAGE_SIZE: int = 100  # Default page size of GET /bookings
+    MAX_BOOKINGS_PAGE_SIZE: int = 500  # Largest page a client may request
+    MAX_LOOKUP_IDS: int = 100  # Most ids in one GET /bookings?ids= or /services?ids= lookup
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched and written per chunk by /admin/bookings/export
+    MAX_SERIES_OCCURRENCES: int = 52  # Most occurrences in one recurring series
+    SLOT_HOLD_MINUTES: int = 10  # Default lifetime of a slot hold
+    MAX_SLOT_HOLD_MINUTES: int = 30  # Longest hold a client may request
+    MAX_HOLDS_PER_USER: int = 3  # Active holds one user may keep at a time
+    WAITLIST_OFFER_MINUTES: int = 30  # How long a freed slot is held for a waitlisted user
+    WAITLIST_SWEEP_SECONDS: int = 60  # How often lapsed waitlist offers are passed on, 0 disables
+    
+    # Idempotency-Key handling for booking writes
+    IDEMPOTENCY_BACKEND: str = "memory"  # "memory" (per process) or "database" (shared by workers)
+    IDEMPOTENCY_TTL_HOURS: int = 24  # How long a key replays its first response
+    IDEMPOTENCY_CACHE_SIZE: int = 10000  # Keys kept by the memory backend
+    
+    # Availability
+    MAX_SLOT_RANGE_DAYS: int = 92  # Longest range served by /availability/slots/range
+    NEXT_SLOT_HORIZON_DAYS: int = 90  # Furthest /availability/next searches ahead
+    SLOT_CACHE_SIZE: int = 2048  # Cached (date, duration, interval) slot lists, 0 disables
+    OCCUPANCY_CACHE_SIZE: int = 256  # Cached per-day occupancy maps (~12 KB each), 0 disables
+    SLOT_CACHE_TTL_SECONDS: int = 30  # Max age of cached slots and occupancy maps, 0 = no limit
+    SERVICE_CATALOG_TTL_SECONDS: int = 300  # Reload the in-memory service catalog at least this often
+    AVAILABILITY_TEMPLATE_TTL_SECONDS: int = 60  # Recompile the availability template at least this often
+    
+    # Admin analytics
+    MAX_ANALYTICS_RANGE_DAYS: int = 731  # Longest range served by /admin/analytics endpoints
+    ANALYTICS_CACHE_SIZE: int = 256  # Cached /admin/analytics/timeseries results, 0 disables
+    ANALYTICS_CACHE_TTL_SECONDS: int = 60  # Max age of a cached time series, 0 = no limit
+    
+    # Responses
+    FAST_JSON_RESPONSES: bool = False  # List endpoints skip response-model validation and use orjson if installed
+    GZIP_MINIMUM_SIZE: int = 0  # Gzip responses at least this many bytes when clients accept it, 0 disables
     
     # CORS
     ALLOWED_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:3001"]
@@ -1,19 +1,155 @@
+from sqlalchemy import inspect
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel, create_engine, Session
 from typing import Generator
 from app.core.config import settings
+from app.core.stats_rollup import install_stats_rollup
 
 
 # Create database engine
+# Routes are async and use sync sessions on the event loop thread, and a
+# session keeps its connection until the request ends. A bounded pool would
+# make the request after the last free connection block the whole loop until
+# pool_timeout, so every session opens its own (cheap) SQLite connection.
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False},  # Needed for SQLite
+    poolclass=NullPool,
     echo=settings.DEBUG  # Log SQL queries in debug mode
 )
 
 
+# SQLite triggers that reject overlapping active bookings. Within a process a
+# conflict check and its write run without awaiting in between; the triggers
+# run inside the writing transaction, so they also hold across worker processes.
+BOOKING_OVERLAP_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS booking_reject_overlap_insert
+    BEFORE INSERT ON booking
+    WHEN NEW.status != 'cancelled' AND EXISTS (
+        SELECT 1 FROM booking
+        WHERE booking_date = NEW.booking_date
+          AND status IN ('pending', 'confirmed')
+          AND start_time < NEW.end_time
+          AND end_time > NEW.start_time
+    )
+    BEGIN
+        SELECT RAISE(ABORT, 'booking overlaps an existing booking');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS booking_reject_overlap_update
+    BEFORE UPDATE OF booking_date, start_time, end_time, status ON booking
+    WHEN NEW.status != 'cancelled'
+      AND (
+        OLD.status = 'cancelled'
+        OR NEW.booking_date != OLD.booking_date
+        OR NEW.start_time != OLD.start_time
+        OR NEW.end_time != OLD.end_time
+      )
+      AND EXISTS (
+        SELECT 1 FROM booking
+        WHERE booking_date = NEW.booking_date
+          AND status IN ('pending', 'confirmed')
+          AND start_time < NEW.end_time
+          AND end_time > NEW.start_time
+          AND id != NEW.id
+    )
+    BEGIN
+        SELECT RAISE(ABORT, 'booking overlaps an existing booking');
+    END
+    """,
+]
+
+
+# SQLite FTS5 index over service names and descriptions. It is an external
+# content table reading from service, kept in sync by the triggers below.
+SERVICE_FTS_TABLE = """
+CREATE VIRTUAL TABLE service_fts USING fts5(
+    name,
+    description,
+    content='service',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+)
+"""
+
+SERVICE_FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS service_fts_insert AFTER INSERT ON service
+    BEGIN
+        INSERT INTO service_fts(rowid, name, description)
+        VALUES (NEW.id, NEW.name, NEW.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS service_fts_delete AFTER DELETE ON service
+    BEGIN
+        INSERT INTO service_fts(service_fts, rowid, name, description)
+        VALUES ('delete', OLD.id, OLD.name, OLD.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS service_fts_update AFTER UPDATE OF name, description ON service
+    BEGIN
+        INSERT INTO service_fts(service_fts, rowid, name, description)
+        VALUES ('delete', OLD.id, OLD.name, OLD.description);
+        INSERT INTO service_fts(rowid, name, description)
+        VALUES (NEW.id, NEW.name, NEW.description);
+    END
+    """,
+]
+
+
+def create_service_search_index() -> None:
+    """Create the service FTS5 table and triggers, indexing existing services once"""
+    with engine.begin() as connection:
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'service_fts'"
+        ).first()
+        if not exists:
+            connection.exec_driver_sql(SERVICE_FTS_TABLE)
+            connection.exec_driver_sql("INSERT INTO service_fts(service_fts) VALUES ('rebuild')")
+        for trigger in SERVICE_FTS_TRIGGERS:
+            connection.exec_driver_sql(trigger)
+
+
+def add_missing_columns() -> None:
+    """
+    Add nullable columns introduced after a table was first created
+    
+    create_all never alters existing tables, so new optional model fields
+    are added here with ALTER TABLE ... ADD COLUMN.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.exec_driver_sql(
+                    f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+                )
+
+
 def create_db_and_tables() -> None:
-    """Create all database tables"""
+    """Create all database tables, plus columns and indexes missing from existing ones"""
     SQLModel.metadata.create_all(engine)
+    add_missing_columns()
+    
+    # create_all skips tables that already exist, so add new indexes separately
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as connection:
+            for trigger in BOOKING_OVERLAP_TRIGGERS:
+                connection.exec_driver_sql(trigger)
+        create_service_search_index()
+        install_stats_rollup(engine)
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -4,6 +4,7 @@ Currently implemented as console logging for development
 In production, integrate with SMTP service (SendGrid, AWS SES, etc.)
 """
 from datetime import datetime
+from typing import List
 
 
 async def send_booking_confirmation(
@@ -42,6 +43,17 @@ async def send_booking_confirmation(
     print("="*60 + "\n")
 
 
+async def send_booking_confirmations(notifications: List[dict]):
+    """
+    Send a batch of booking confirmation emails
+    
+    Args:
+        notifications: Keyword arguments for send_booking_confirmation, one per booking
+    """
+    for notification in notifications:
+        await send_booking_confirmation(**notification)
+
+
 async def send_status_update(
     user_email: str,
     user_name: str,
@@ -89,6 +101,17 @@ async def send_status_update(
     print("="*60 + "\n")
 
 
+async def send_status_updates(notifications: List[dict]):
+    """
+    Send a batch of booking status update emails
+    
+    Args:
+        notifications: Keyword arguments for send_status_update, one per booking
+    """
+    for notification in notifications:
+        await send_status_update(**notification)
+
+
 async def send_cancellation_notice(
     user_email: str,
     user_name: str,
@@ -121,3 +144,65 @@ async def send_cancellation_notice(
     print(f"   Time: {start_time}")
     print(f"\nWe hope to serve you again in the future.")
     print("="*60 + "\n")
+
+
+async def send_cancellation_notices(notifications: List[dict]):
+    """
+    Send a batch of booking cancellation notices
+    
+    Args:
+        notifications: Keyword arguments for send_cancellation_notice, one per booking
+    """
+    for notification in notifications:
+        await send_cancellation_notice(**notification)
+
+
+async def send_waitlist_offer(
+    user_email: str,
+    user_name: str,
+    service_name: str,
+    booking_date: str,
+    start_time: str,
+    end_time: str,
+    hold_id: str,
+    expires_at: str
+):
+    """
+    Tell a waitlisted user that their slot is free and held for them
+    
+    Args:
+        user_email: Recipient email address
+        user_name: User's full name
+        service_name: Name of the service
+        booking_date: Date of the freed slot
+        start_time: Start time of the freed slot
+        end_time: End time of the freed slot
+        hold_id: Hold to confirm with POST /bookings/holds/{hold_id}/confirm
+        expires_at: When the hold lapses (UTC)
+    """
+    print("\n" + "="*60)
+    print("📧 [EMAIL NOTIFICATION - Waitlist]")
+    print("="*60)
+    print(f"To: {user_email}")
+    print(f"Subject: A slot opened up - {service_name}")
+    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+    print(f"Dear {user_name},")
+    print(f"\nThe slot you were waiting for is now available and held for you.")
+    print(f"\n📅 Details:")
+    print(f"   Service: {service_name}")
+    print(f"   Date: {booking_date}")
+    print(f"   Time: {start_time} - {end_time}")
+    print(f"\n⏳ Confirm before {expires_at} UTC (hold {hold_id}).")
+    print("="*60 + "\n")
+
+
+async def send_waitlist_offers(notifications: List[dict]):
+    """
+    Send a batch of waitlist offers
+    
+    Args:
+        notifications: Keyword arguments for send_waitlist_offer, one per offer
+    """
+    for notification in notifications:
+        await send_waitlist_offer(**notification)
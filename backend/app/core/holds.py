@@ -0,0 +1,143 @@
+"""
+Time-limited slot holds
+
+A hold reserves a slot for a few minutes while a customer checks out.
+Holds live in process memory: a dict by id and by date for lookups, plus a
+heap ordered by expiry so expired holds are dropped lazily, in O(log n),
+the next time the store is touched.
+"""
+import heapq
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from app.core.cache import invalidate_slot_dates
+
+
+@dataclass(frozen=True)
+class SlotHold:
+    """A slot reserved for one user until expires_at"""
+    id: str
+    user_id: int
+    service_id: int
+    booking_date: date
+    start_time: time
+    end_time: time
+    expires_at: datetime
+
+
+class HoldStore:
+    """Thread-safe in-memory store of active holds"""
+
+    def __init__(self):
+        self._holds: Dict[str, SlotHold] = {}
+        self._by_date: Dict[date, Dict[str, SlotHold]] = {}
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        self._lock = Lock()
+
+    def _remove(self, hold: SlotHold) -> None:
+        del self._holds[hold.id]
+        day_holds = self._by_date[hold.booking_date]
+        del day_holds[hold.id]
+        if not day_holds:
+            del self._by_date[hold.booking_date]
+
+    def purge_expired(self) -> List[SlotHold]:
+        """Drop expired holds and the cached slots they were blocking"""
+        now = datetime.utcnow()
+        expired = []
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                _, hold_id = heapq.heappop(self._expiry_heap)
+                hold = self._holds.get(hold_id)
+                if hold is not None:
+                    self._remove(hold)
+                    expired.append(hold)
+        if expired:
+            invalidate_slot_dates(*{hold.booking_date for hold in expired})
+        return expired
+
+    def create(
+        self,
+        user_id: int,
+        service_id: int,
+        booking_date: date,
+        start_time: time,
+        end_time: time,
+        minutes: int
+    ) -> SlotHold:
+        """Add a hold (callers check for conflicts first)"""
+        self.purge_expired()
+        hold = SlotHold(
+            id=uuid4().hex,
+            user_id=user_id,
+            service_id=service_id,
+            booking_date=booking_date,
+            start_time=start_time,
+            end_time=end_time,
+            expires_at=datetime.utcnow() + timedelta(minutes=minutes)
+        )
+        with self._lock:
+            self._holds[hold.id] = hold
+            self._by_date.setdefault(booking_date, {})[hold.id] = hold
+            heapq.heappush(self._expiry_heap, (hold.expires_at, hold.id))
+        invalidate_slot_dates(booking_date)
+        return hold
+
+    def get(self, hold_id: str) -> Optional[SlotHold]:
+        """Return an active hold, or None if it expired or never existed"""
+        self.purge_expired()
+        return self._holds.get(hold_id)
+
+    def release(self, hold_id: str) -> Optional[SlotHold]:
+        """Remove a hold, returning it if it was still active"""
+        self.purge_expired()
+        with self._lock:
+            hold = self._holds.get(hold_id)
+            if hold is not None:
+                self._remove(hold)
+        if hold is not None:
+            invalidate_slot_dates(hold.booking_date)
+        return hold
+
+    def for_date(self, booking_date: date) -> List[SlotHold]:
+        """Active holds on a date"""
+        self.purge_expired()
+        with self._lock:
+            return list(self._by_date.get(booking_date, {}).values())
+
+    def between(self, start_date: date, end_date: date) -> List[SlotHold]:
+        """Active holds on dates from start_date to end_date, inclusive"""
+        self.purge_expired()
+        with self._lock:
+            return [
+                hold
+                for day, day_holds in self._by_date.items()
+                if start_date <= day <= end_date
+                for hold in day_holds.values()
+            ]
+
+    def count_for_user(self, user_id: int) -> int:
+        """Number of active holds owned by a user"""
+        self.purge_expired()
+        with self._lock:
+            return sum(1 for hold in self._holds.values() if hold.user_id == user_id)
+
+    def overlaps(
+        self,
+        booking_date: date,
+        start_time: time,
+        end_time: time,
+        exclude_user_id: int | None = None
+    ) -> bool:
+        """True if another user's active hold overlaps the given slot"""
+        return any(
+            start_time < hold.end_time and end_time > hold.start_time
+            for hold in self.for_date(booking_date)
+            if hold.user_id != exclude_user_id
+        )
+
+
+hold_store = HoldStore()
@@ -0,0 +1,283 @@
+"""
+Idempotency-Key support for mutating booking routes
+
+A client that retries a POST/PUT/DELETE with the same Idempotency-Key header
+gets the stored response of the first attempt back, without the request
+reaching the routes (or the booking tables) again. Keys are scoped to the
+caller's access token, method and path, and expire after
+IDEMPOTENCY_TTL_HOURS.
+
+Two stores are available via IDEMPOTENCY_BACKEND: "memory", a bounded LRU
+per process, and "database", a table shared by every worker process.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, delete
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.idempotency import IdempotencyRecord
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENT_METHODS = {"POST", "PUT", "DELETE"}
+MAX_KEY_LENGTH = 255
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """Response replayed for a repeated key"""
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+
+
+@dataclass(frozen=True)
+class IdempotencyEntry:
+    """State of a key: response is None while the first request is in flight"""
+    fingerprint: str
+    response: Optional[StoredResponse]
+    expires_at: datetime
+
+
+class MemoryIdempotencyStore:
+    """Bounded in-process LRU of idempotency entries with a TTL"""
+
+    def __init__(self, maxsize: int, ttl: timedelta):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def claim(self, key: str, fingerprint: str) -> Optional[IdempotencyEntry]:
+        """
+        Claim a key for a new request
+
+        Returns None if the caller now owns the key, otherwise the existing
+        entry for it.
+        """
+        now = datetime.utcnow()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                return entry
+            self._entries[key] = IdempotencyEntry(fingerprint, None, now + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return None
+
+    def complete(self, key: str, response: StoredResponse) -> None:
+        """Store the response for a claimed key"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = replace(entry, response=response)
+
+    def release(self, key: str) -> None:
+        """Forget a claimed key so the request can be retried"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class DatabaseIdempotencyStore:
+    """Idempotency entries in the idempotency_record table"""
+
+    def __init__(self, ttl: timedelta):
+        self.ttl = ttl
+
+    def claim(self, key: str, fingerprint: str) -> Optional[IdempotencyEntry]:
+        """
+        Claim a key for a new request
+
+        The primary key makes the claim atomic across processes. Returns
+        None if the caller now owns the key, otherwise the existing entry.
+        """
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            session.exec(delete(IdempotencyRecord).where(IdempotencyRecord.expires_at <= now))
+            session.add(IdempotencyRecord(key=key, fingerprint=fingerprint, expires_at=now + self.ttl))
+            try:
+                session.commit()
+                return None
+            except IntegrityError:
+                session.rollback()
+
+            record = session.get(IdempotencyRecord, key)
+            if record is None:
+                return None  # Released in the meantime; the retry proceeds unguarded
+
+            response = None
+            if record.status_code is not None:
+                response = StoredResponse(
+                    status_code=record.status_code,
+                    headers=[tuple(header) for header in json.loads(record.headers)],
+                    body=record.body
+                )
+            return IdempotencyEntry(record.fingerprint, response, record.expires_at)
+
+    def complete(self, key: str, response: StoredResponse) -> None:
+        """Store the response for a claimed key"""
+        with Session(engine) as session:
+            record = session.get(IdempotencyRecord, key)
+            if record is None:
+                return
+            record.status_code = response.status_code
+            record.headers = json.dumps(response.headers)
+            record.body = response.body
+            session.add(record)
+            session.commit()
+
+    def release(self, key: str) -> None:
+        """Forget a claimed key so the request can be retried"""
+        with Session(engine) as session:
+            session.exec(delete(IdempotencyRecord).where(IdempotencyRecord.key == key))
+            session.commit()
+
+
+def create_idempotency_store():
+    """Build the store selected by IDEMPOTENCY_BACKEND"""
+    ttl = timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS)
+    if settings.IDEMPOTENCY_BACKEND == "database":
+        return DatabaseIdempotencyStore(ttl)
+    return MemoryIdempotencyStore(settings.IDEMPOTENCY_CACHE_SIZE, ttl)
+
+
+idempotency_store = create_idempotency_store()
+
+
+def _sha256(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class IdempotencyMiddleware:
+    """
+    Replay stored responses for repeated Idempotency-Key requests
+
+    Only mutating requests under the given path prefixes are handled.
+    Responses with a 5xx status are not stored, so those requests can be
+    retried with the same key. Written as plain ASGI so every other
+    request passes straight through, unbuffered.
+    """
+
+    def __init__(self, app: ASGIApp, store, path_prefixes: Tuple[str, ...] = ("/bookings",)):
+        self.app = app
+        self.store = store
+        self.path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+        if (
+            not idempotency_key
+            or request.method not in IDEMPOTENT_METHODS
+            or not request.url.path.startswith(self.path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters"}
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await Request(scope, receive).body()
+        key = _sha256(
+            request.cookies.get("access_token", "").encode(),
+            request.method.encode(),
+            request.url.path.encode(),
+            idempotency_key.encode()
+        )
+        fingerprint = _sha256(request.url.query.encode(), body)
+
+        entry = self.store.claim(key, fingerprint)
+        if entry is not None:
+            await self._reject_or_replay(entry, fingerprint)(scope, receive, send)
+            return
+
+        body_sent = False
+
+        async def receive_body() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        start: Message = {}
+        chunks: List[bytes] = []
+        finished = False
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal start, finished
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    # Store before background tasks run so retries replay at once
+                    finished = True
+                    self._record(key, start, b"".join(chunks))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_body, send_and_record)
+        finally:
+            if not finished:
+                self.store.release(key)
+
+    def _reject_or_replay(self, entry: IdempotencyEntry, fingerprint: str) -> Response:
+        """Response for a key that was already claimed"""
+        if entry.fingerprint != fingerprint:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": f"{IDEMPOTENCY_HEADER} was already used for a different request"}
+            )
+        if entry.response is None:
+            return JSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content={"detail": f"A request with this {IDEMPOTENCY_HEADER} is still in progress"}
+            )
+        replayed = Response(content=entry.response.body, status_code=entry.response.status_code)
+        replayed.raw_headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in entry.response.headers
+        ]
+        replayed.headers["Idempotent-Replayed"] = "true"
+        return replayed
+
+    def _record(self, key: str, start: Message, body: bytes) -> None:
+        """Store a finished response, or free the key after a server error"""
+        if start["status"] >= 500:
+            self.store.release(key)
+            return
+        self.store.complete(key, StoredResponse(
+            status_code=start["status"],
+            headers=[
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in start.get("headers", [])
+            ],
+            body=body
+        ))
@@ -0,0 +1,137 @@
+"""
+Process-local service catalog
+
+Services are few and rarely change, but nearly every booking and
+availability request looks one up. The catalog keeps detached copies of
+all services in memory for O(1) lookup by id, plus the active-services
+list already encoded as JSON. It is loaded at startup and reloaded after
+service writes in this process, after SERVICE_CATALOG_TTL_SECONDS (to pick
+up writes from other workers), and when a lookup misses a service that
+does exist in the table. Misses for ids that do not exist cost one
+primary-key query and never reload the catalog.
+"""
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models.service import Service
+
+
+class ServiceCatalog:
+    """In-memory copy of the Service table with hit/miss counters"""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._by_id: Dict[int, Service] = {}
+        self._services: List[Service] = []
+        self._active_json: Optional[bytes] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def refresh(self, session: Session) -> None:
+        """Reload every service (call after any service write)"""
+        services = [
+            Service(**service.model_dump())  # Detached copies, safe to share
+            for service in session.exec(select(Service).order_by(Service.id)).all()
+        ]
+        with self._lock:
+            self._services = services
+            self._by_id = {service.id: service for service in services}
+            self._active_json = None
+            self._loaded_at = time.monotonic()
+            self.reloads += 1
+
+    def _ensure_fresh(self, session: Session) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.ttl_seconds:
+            self.refresh(session)
+
+    def _reload_if_created(self, session: Session, service_ids: List[int]) -> None:
+        """Reload if any of the missed ids exists, i.e. another worker created it"""
+        if session.exec(select(Service.id).where(Service.id.in_(service_ids)).limit(1)).first() is not None:
+            self.refresh(session)
+
+    def get(self, session: Session, service_id: int) -> Optional[Service]:
+        """
+        Look up a service by id
+
+        A miss checks the table for that id and reloads the catalog only
+        if another worker created the service. Returned objects are shared
+        and must not be modified.
+        """
+        self._ensure_fresh(session)
+        service = self._by_id.get(service_id)
+        if service is not None:
+            self.hits += 1
+            return service
+
+        self.misses += 1
+        self._reload_if_created(session, [service_id])
+        return self._by_id.get(service_id)
+
+    def get_many(self, session: Session, service_ids: List[int]) -> Dict[int, Service]:
+        """Look up several services, checking all misses with one query"""
+        self._ensure_fresh(session)
+        found = {
+            service_id: self._by_id[service_id]
+            for service_id in service_ids
+            if service_id in self._by_id
+        }
+        self.hits += len(found)
+        missing = [service_id for service_id in service_ids if service_id not in found]
+        if missing:
+            self.misses += len(missing)
+            self._reload_if_created(session, missing)
+            found = {
+                service_id: self._by_id[service_id]
+                for service_id in service_ids
+                if service_id in self._by_id
+            }
+        return found
+
+    def all(self, session: Session, active_only: bool = False) -> List[Service]:
+        """All services ordered by id, optionally only active ones"""
+        self._ensure_fresh(session)
+        self.hits += 1
+        if active_only:
+            return [service for service in self._services if service.is_active]
+        return list(self._services)
+
+    def active_json(self, session: Session, encode: Callable[[List[Service]], bytes]) -> bytes:
+        """
+        Active services encoded once per catalog load
+
+        Args:
+            session: Database session, used only when the catalog is stale
+            encode: Serializes the active services (e.g. a response model adapter)
+        """
+        self._ensure_fresh(session)
+        payload = self._active_json
+        if payload is None:
+            payload = encode([service for service in self._services if service.is_active])
+            with self._lock:
+                self._active_json = payload
+        self.hits += 1
+        return payload
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        loaded_at = self._loaded_at
+        return {
+            "size": len(self._services),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "reloads": self.reloads,
+            "age_seconds": round(time.monotonic() - loaded_at, 1) if loaded_at is not None else None,
+        }
+
+
+service_catalog = ServiceCatalog(ttl_seconds=settings.SERVICE_CATALOG_TTL_SECONDS)
@@ -0,0 +1,155 @@
+"""
+Slot engine for availability calculation
+
+All times are handled as integer minutes since midnight. DayOccupancy
+turns a day's working windows and busy intervals (bookings and holds) into
+a per-minute prefix sum with numpy, so a day can be cached once and then
+queried for any service duration, checking every candidate slot of a
+window in one vectorized comparison instead of testing each candidate
+against every booking.
+"""
+from datetime import time
+from itertools import chain
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+
+MINUTES_PER_DAY = 24 * 60
+
+# (start, end) in minutes since midnight, end exclusive
+Interval = Tuple[int, int]
+
+# (start, end, anchor): slot start times are aligned to anchor + k * interval
+Window = Tuple[int, int, int]
+
+
+def to_minutes(value: time, round_up: bool = False) -> int:
+    """
+    Convert a time to minutes since midnight
+
+    Args:
+        value: Time to convert
+        round_up: Round partial minutes up instead of down
+    """
+    minutes = value.hour * 60 + value.minute
+    if round_up and (value.second or value.microsecond):
+        minutes += 1
+    return minutes
+
+
+def from_minutes(minutes: int) -> time:
+    """Convert minutes since midnight back to a time"""
+    return time(hour=minutes // 60, minute=minutes % 60)
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """
+    Sort and merge overlapping or touching intervals
+
+    Empty intervals are dropped.
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(intervals: List[Interval], removed: List[Interval]) -> List[Interval]:
+    """
+    Remove intervals from other intervals
+
+    Both lists must already be sorted and merged (see merge_intervals).
+    """
+    result: List[Interval] = []
+    index = 0
+    for start, end in intervals:
+        while index < len(removed) and removed[index][1] <= start:
+            index += 1
+        current = start
+        scan = index
+        while scan < len(removed) and removed[scan][0] < end:
+            if removed[scan][0] > current:
+                result.append((current, removed[scan][0]))
+            current = max(current, removed[scan][1])
+            scan += 1
+        if current < end:
+            result.append((current, end))
+    return result
+
+
+def _first_aligned(start: int, anchor: int, interval: int) -> int:
+    """Smallest anchor + k * interval that is >= start"""
+    if start <= anchor:
+        return anchor
+    return anchor + -(-(start - anchor) // interval) * interval
+
+
+def _busy_minutes(busy: Iterable[Interval]) -> np.ndarray:
+    """True for each minute of the day covered by at least one busy interval"""
+    bounds = np.fromiter(chain.from_iterable(busy), dtype=np.int64)
+    np.clip(bounds, 0, MINUTES_PER_DAY, out=bounds)
+    starts, ends = bounds[0::2], bounds[1::2]
+    nonempty = ends > starts
+    # +1 where an interval starts and -1 where one ends; the running total
+    # is the number of intervals covering each minute
+    changes = (
+        np.bincount(starts[nonempty], minlength=MINUTES_PER_DAY + 1)
+        - np.bincount(ends[nonempty], minlength=MINUTES_PER_DAY + 1)
+    )
+    return np.cumsum(changes[:MINUTES_PER_DAY]) > 0
+
+
+class DayOccupancy:
+    """
+    Minute-resolution occupancy map for one day
+
+    A minute is occupied unless it is inside a free window and outside
+    every busy interval. Busy minutes come from a difference array and a
+    cumulative sum rather than painting each booking, and a prefix sum over
+    the occupied minutes turns "is this slot free" into a single
+    subtraction. The map does not depend on service duration or slot
+    interval, so one cached instance answers slot queries for every
+    service on that date.
+    """
+
+    __slots__ = ("windows", "occupied_before")
+
+    def __init__(self, windows: Iterable[Window], busy: Iterable[Interval]):
+        self.windows = list(windows)
+
+        occupied = np.ones(MINUTES_PER_DAY, dtype=bool)
+        for start, end, _ in self.windows:
+            occupied[max(start, 0):max(min(end, MINUTES_PER_DAY), 0)] = False
+        occupied |= _busy_minutes(busy)
+
+        # occupied_before[m] = number of occupied minutes in [0, m)
+        self.occupied_before = np.zeros(MINUTES_PER_DAY + 1, dtype=np.int64)
+        np.cumsum(occupied, out=self.occupied_before[1:])
+
+    def free_slots(self, duration: int, interval: int) -> List[Interval]:
+        """
+        Find every free slot of the given duration
+
+        Slot starts are aligned to each window's anchor, step by interval
+        and are returned in window order as (start, end) minute tuples.
+        """
+        if duration <= 0 or interval <= 0:
+            return []
+
+        occupied_before = self.occupied_before
+        slots: List[Interval] = []
+        for window_start, window_end, anchor in self.windows:
+            last_start = min(window_end, MINUTES_PER_DAY) - duration
+            starts = np.arange(_first_aligned(window_start, anchor, interval), last_start + 1, interval)
+            if not len(starts):
+                continue
+            starts = starts[occupied_before[starts + duration] == occupied_before[starts]]
+            slots.extend(zip(starts.tolist(), (starts + duration).tolist()))
+        return slots
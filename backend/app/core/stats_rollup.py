@@ -0,0 +1,167 @@
+"""
+daily_stats rollup for the admin dashboard
+
+One row per (day, service) holds the number of bookings in any status,
+the number of pending, confirmed and cancelled ones, and the confirmed
+revenue. SQLite triggers on booking
+keep the rows current inside every writing transaction (single and bulk
+creates, series, hold confirmation, updates, cancellations and admin
+status changes alike), and a trigger on service reprices the revenue when
+a service price changes. Dashboard queries then read a few rollup rows
+instead of scanning every booking.
+
+Rebuild the table from the bookings (e.g. after restoring a backup or
+editing bookings by hand) from the backend directory:
+    python -m app.core.stats_rollup
+"""
+from sqlalchemy.engine import Connection, Engine
+
+
+# Adds one booking's status and revenue to its (day, service) row; used with
+# NEW.* by the insert and update triggers
+_ADD_BOOKING = """
+    INSERT INTO daily_stats (
+        day, service_id, booking_count, pending_count, confirmed_count, cancelled_count, confirmed_revenue
+    )
+    VALUES (
+        NEW.booking_date,
+        NEW.service_id,
+        1,
+        NEW.status = 'pending',
+        NEW.status = 'confirmed',
+        NEW.status = 'cancelled',
+        COALESCE((NEW.status = 'confirmed') * (SELECT price FROM service WHERE id = NEW.service_id), 0)
+    )
+    ON CONFLICT (day, service_id) DO UPDATE SET
+        booking_count = booking_count + 1,
+        pending_count = pending_count + excluded.pending_count,
+        confirmed_count = confirmed_count + excluded.confirmed_count,
+        cancelled_count = cancelled_count + excluded.cancelled_count,
+        confirmed_revenue = COALESCE(
+            (confirmed_count + excluded.confirmed_count)
+            * (SELECT price FROM service WHERE id = excluded.service_id),
+            0
+        );
+"""
+
+# Removes one booking from its (day, service) row; used with OLD.* by the
+# update and delete triggers
+_REMOVE_BOOKING = """
+    UPDATE daily_stats SET
+        booking_count = booking_count - 1,
+        pending_count = pending_count - (OLD.status = 'pending'),
+        confirmed_count = confirmed_count - (OLD.status = 'confirmed'),
+        cancelled_count = cancelled_count - (OLD.status = 'cancelled'),
+        confirmed_revenue = COALESCE(
+            (confirmed_count - (OLD.status = 'confirmed'))
+            * (SELECT price FROM service WHERE id = OLD.service_id),
+            0
+        )
+    WHERE day = OLD.booking_date AND service_id = OLD.service_id;
+"""
+
+DAILY_STATS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_booking_insert AFTER INSERT ON booking
+    BEGIN
+        {_ADD_BOOKING}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_booking_update
+    AFTER UPDATE OF booking_date, service_id, status ON booking
+    WHEN NEW.booking_date != OLD.booking_date
+      OR NEW.service_id != OLD.service_id
+      OR NEW.status != OLD.status
+    BEGIN
+        {_REMOVE_BOOKING}
+        {_ADD_BOOKING}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_booking_delete AFTER DELETE ON booking
+    BEGIN
+        {_REMOVE_BOOKING}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS daily_stats_service_price AFTER UPDATE OF price ON service
+    WHEN NEW.price != OLD.price
+    BEGIN
+        UPDATE daily_stats SET confirmed_revenue = confirmed_count * NEW.price
+        WHERE service_id = NEW.id;
+    END
+    """,
+]
+
+DAILY_STATS_TRIGGER_NAMES = [
+    "daily_stats_booking_insert",
+    "daily_stats_booking_update",
+    "daily_stats_booking_delete",
+    "daily_stats_service_price",
+]
+
+REBUILD_DAILY_STATS = [
+    "DELETE FROM daily_stats",
+    """
+    INSERT INTO daily_stats (
+        day, service_id, booking_count, pending_count, confirmed_count, cancelled_count, confirmed_revenue
+    )
+    SELECT
+        booking.booking_date,
+        booking.service_id,
+        COUNT(*),
+        SUM(booking.status = 'pending'),
+        SUM(booking.status = 'confirmed'),
+        SUM(booking.status = 'cancelled'),
+        COALESCE(SUM(booking.status = 'confirmed') * service.price, 0)
+    FROM booking
+    JOIN service ON service.id = booking.service_id
+    GROUP BY booking.booking_date, booking.service_id
+    """,
+]
+
+
+def rebuild_daily_stats(connection: Connection) -> None:
+    """Recompute every daily_stats row from the booking table"""
+    for statement in REBUILD_DAILY_STATS:
+        connection.exec_driver_sql(statement)
+
+
+def install_stats_rollup(engine: Engine) -> None:
+    """
+    Create the daily_stats triggers (SQLite), filling the table the first time
+
+    Databases created before daily_stats.booking_count existed get the
+    column, replacement triggers and a rebuild.
+    """
+    with engine.begin() as connection:
+        insert_trigger = connection.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'daily_stats_booking_insert'"
+        ).scalar()
+        current = insert_trigger is not None and "booking_count" in insert_trigger
+        if not current:
+            columns = {row[1] for row in connection.exec_driver_sql("PRAGMA table_info(daily_stats)")}
+            if "booking_count" not in columns:
+                connection.exec_driver_sql(
+                    "ALTER TABLE daily_stats ADD COLUMN booking_count INTEGER NOT NULL DEFAULT 0"
+                )
+            for name in DAILY_STATS_TRIGGER_NAMES:
+                connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+        for trigger in DAILY_STATS_TRIGGERS:
+            connection.exec_driver_sql(trigger)
+        if not current:
+            rebuild_daily_stats(connection)
+
+
+if __name__ == "__main__":
+    from app.core.database import create_db_and_tables, engine
+    import app.main  # noqa: F401  Registers every model before creating tables
+
+    if engine.dialect.name != "sqlite":
+        raise SystemExit("The daily_stats rollup is only maintained on SQLite")
+    create_db_and_tables()
+    with engine.begin() as connection:
+        rebuild_daily_stats(connection)
+        rows = connection.exec_driver_sql("SELECT COUNT(*) FROM daily_stats").scalar_one()
+    print(f"[OK] Rebuilt daily_stats: {rows} rows")
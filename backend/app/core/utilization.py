@@ -0,0 +1,68 @@
+"""
+Calendar utilization over a date range
+
+Available minutes come from the compiled availability template (working
+hours with blocked periods already cut out), so every date's capacity is
+just its weekday's total. Booked minutes arrive already grouped per date
+by SQL. Both are laid out as numpy arrays with one element per day of the
+range, so a year-long report is a handful of array operations rather than
+a Python loop per day.
+"""
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.slot_engine import Window
+
+
+def weekday_minutes(template: Dict[int, List[Window]]) -> np.ndarray:
+    """Free minutes for each weekday (0=Monday) from the availability template"""
+    minutes = np.zeros(7, dtype=np.int64)
+    for day_of_week, windows in template.items():
+        minutes[day_of_week] = sum(end - start for start, end, _ in windows)
+    return minutes
+
+
+def daily_utilization(
+    date_from: date,
+    date_to: date,
+    available_per_weekday: np.ndarray,
+    booked_dates: Sequence[date],
+    booked_minutes: Sequence[int]
+) -> List[Tuple[date, int, int, Optional[float]]]:
+    """
+    Available minutes, booked minutes and utilization for every day in a range
+
+    Args:
+        date_from: First day of the range
+        date_to: Last day of the range (inclusive)
+        available_per_weekday: Free minutes per weekday, from weekday_minutes
+        booked_dates: Distinct dates within the range that have bookings
+        booked_minutes: Booked minutes on each of booked_dates
+
+    Returns:
+        (date, available, booked, booked / available) per day; utilization
+        is None on days without working hours
+    """
+    day_count = (date_to - date_from).days + 1
+    first_day = np.datetime64(date_from, "D")
+    weekdays = (date_from.weekday() + np.arange(day_count)) % 7
+    available = available_per_weekday[weekdays]
+
+    booked = np.zeros(day_count, dtype=np.int64)
+    if len(booked_dates):
+        offsets = (np.array(booked_dates, dtype="datetime64[D]") - first_day).astype(np.int64)
+        booked[offsets] = booked_minutes
+
+    utilization = np.full(day_count, np.nan)
+    np.divide(booked, available, out=utilization, where=available > 0)
+    utilization = np.round(utilization, 4).astype(object)
+    utilization[available == 0] = None
+
+    return list(zip(
+        (first_day + np.arange(day_count)).tolist(),
+        available.tolist(),
+        booked.tolist(),
+        utilization.tolist()
+    ))
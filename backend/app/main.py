@@ -1,32 +1,60 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
+from sqlmodel import Session
 
 from app.core.config import settings
-from app.core.database import create_db_and_tables
+from app.core.database import create_db_and_tables, engine
+from app.core.idempotency import IdempotencyMiddleware, idempotency_store
+from app.core.service_catalog import service_catalog
 
 # Import models to ensure they're registered with SQLModel
 from app.models.user import User
 from app.models.service import Service
 from app.models.booking import Booking
 from app.models.availability import Availability
+from app.models.daily_stats import DailyStats
+from app.models.idempotency import IdempotencyRecord
+from app.models.waitlist import WaitlistEntry
 
 # Import routers
 from app.api.routes.auth import router as auth_router
 from app.api.routes.services import router as services_router
-from app.api.routes.bookings import router as bookings_router
+from app.api.routes.bookings import expire_waitlist_offers, router as bookings_router
 from app.api.routes.availability import router as availability_router
 from app.api.routes.admin import router as admin_router
 
 
+async def sweep_waitlist_offers(interval_seconds: int) -> None:
+    """Pass lapsed waitlist offers on every interval_seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await expire_waitlist_offers()
+        except Exception as error:  # Keep sweeping after a failed pass
+            print(f"[WARN] Waitlist offer sweep failed: {error}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     # Startup: Create database tables
     create_db_and_tables()
     print("[OK] Database tables created successfully")
+    # Startup: Load the service catalog
+    with Session(engine) as session:
+        service_catalog.refresh(session)
+    # Startup: Pass lapsed waitlist offers on in the background
+    sweeper = None
+    if settings.WAITLIST_SWEEP_SECONDS > 0:
+        sweeper = asyncio.create_task(sweep_waitlist_offers(settings.WAITLIST_SWEEP_SECONDS))
     yield
     # Shutdown: Cleanup (if needed)
+    if sweeper is not None:
+        sweeper.cancel()
     print("Shutting down application")
 
 
@@ -38,6 +66,9 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Replay responses for retried booking writes that send an Idempotency-Key
+app.add_middleware(IdempotencyMiddleware, store=idempotency_store)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -45,8 +76,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Compress large responses (opt-in)
+if settings.GZIP_MINIMUM_SIZE > 0:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(services_router, prefix="/services", tags=["Services"])
@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 from datetime import datetime, date, time
 from typing import Optional
@@ -6,6 +7,24 @@ from typing import Optional
 class Booking(SQLModel, table=True):
     """Booking model for service appointments"""
     
+    __table_args__ = (
+        # Covers overlap checks and slot lookups for a date without reading rows
+        Index("ix_booking_date_status_times", "booking_date", "status", "start_time", "end_time"),
+        # Keyset pagination of GET /bookings: every combination of the equality
+        # filters followed by the (booking_date, start_time, id) sort order
+        Index("ix_booking_page", "booking_date", "start_time"),
+        Index("ix_booking_page_user", "user_id", "booking_date", "start_time"),
+        Index("ix_booking_page_service", "service_id", "booking_date", "start_time"),
+        Index("ix_booking_page_status", "status", "booking_date", "start_time"),
+        Index("ix_booking_page_user_service", "user_id", "service_id", "booking_date", "start_time"),
+        Index("ix_booking_page_user_status", "user_id", "status", "booking_date", "start_time"),
+        Index("ix_booking_page_service_status", "service_id", "status", "booking_date", "start_time"),
+        Index(
+            "ix_booking_page_user_service_status",
+            "user_id", "service_id", "status", "booking_date", "start_time"
+        ),
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id", index=True)
     service_id: int = Field(foreign_key="service.id", index=True)
@@ -13,4 +32,5 @@ class Booking(SQLModel, table=True):
     start_time: time
     end_time: time
     status: str = Field(default="pending")  # "pending", "confirmed", "cancelled"
+    series_id: Optional[str] = Field(default=None, index=True)  # Set for recurring bookings
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,16 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+
+
+class DailyStats(SQLModel, table=True):
+    """Booking counts and confirmed revenue per day and service, kept by triggers on booking"""
+
+    __tablename__ = "daily_stats"
+
+    day: date = Field(primary_key=True)
+    service_id: int = Field(primary_key=True, foreign_key="service.id")
+    booking_count: int = Field(default=0)  # Bookings in any status, including ones not counted below
+    pending_count: int = Field(default=0)
+    confirmed_count: int = Field(default=0)
+    cancelled_count: int = Field(default=0)
+    confirmed_revenue: float = Field(default=0.0)  # confirmed_count * current service price
@@ -0,0 +1,16 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+from typing import Optional
+
+
+class IdempotencyRecord(SQLModel, table=True):
+    """Stored response for an Idempotency-Key, shared by all worker processes"""
+
+    __tablename__ = "idempotency_record"
+
+    key: str = Field(primary_key=True)  # Hash of user, method, path and header value
+    fingerprint: str  # Hash of the request query and body
+    status_code: Optional[int] = None  # None while the first request is in flight
+    headers: Optional[str] = None  # JSON list of [name, value] pairs
+    body: Optional[bytes] = None
+    expires_at: datetime = Field(index=True)
@@ -0,0 +1,26 @@
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field
+from datetime import datetime, date, time
+from typing import Optional
+
+
+class WaitlistEntry(SQLModel, table=True):
+    """Waitlist entry for a slot that was already booked"""
+
+    __table_args__ = (
+        # Finds the entries a freed slot can satisfy with one range scan per cancellation
+        Index("ix_waitlist_date_start_service", "booking_date", "start_time", "service_id"),
+        # Finds offers that lapsed without being confirmed
+        Index("ix_waitlist_status_offered_at", "status", "offered_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user.id", index=True)
+    service_id: int = Field(foreign_key="service.id")
+    booking_date: date
+    start_time: time
+    end_time: time
+    status: str = Field(default="waiting")  # "waiting", "offered", "booked", "expired", "removed"
+    hold_id: Optional[str] = Field(default=None, index=True)  # Slot hold created when the entry was offered
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    offered_at: Optional[datetime] = None
@@ -0,0 +1,87 @@
+"""
+Benchmark list endpoint serialization
+
+Compares, per booking row, the default FastAPI path (validate every row
+into the response model, dump it to JSON-compatible Python, encode with
+the json module), validation with a precompiled TypeAdapter encoded by
+pydantic-core, and the FAST_JSON_RESPONSES path (copy the response
+fields off the rows and encode with orjson, or pydantic-core when orjson
+is not installed).
+
+Run from the backend directory:
+    python -m benchmarks.bench_serialization
+"""
+import json
+import timeit
+from datetime import date, datetime, time, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.api.routes.bookings import BOOKING_RESPONSE_FIELDS, BookingResponse
+from app.core import serialization
+from app.models.booking import Booking
+
+
+booking_list_adapter = TypeAdapter(List[BookingResponse])
+
+
+def make_bookings(count):
+    bookings = []
+    for index in range(count):
+        start = 8 * 60 + (index % 20) * 30
+        bookings.append(Booking(
+            id=index + 1,
+            user_id=index % 50 + 1,
+            service_id=index % 7 + 1,
+            booking_date=date(2030, 1, 1) + timedelta(days=index // 20),
+            start_time=time(start // 60, start % 60),
+            end_time=time(start // 60, start % 60 + 29),
+            status=("pending", "confirmed", "cancelled")[index % 3],
+            series_id="3f2b9c" if index % 4 == 0 else None,
+            created_at=datetime(2026, 1, 1, 12, 0, index % 60, 123456)
+        ))
+    return bookings
+
+
+def response_model_path(bookings):
+    """What FastAPI does for response_model=List[BookingResponse]"""
+    validated = booking_list_adapter.validate_python(bookings, from_attributes=True)
+    content = booking_list_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def adapter_path(bookings):
+    """Precompiled TypeAdapter validation, encoded by pydantic-core"""
+    return booking_list_adapter.dump_json(booking_list_adapter.validate_python(bookings, from_attributes=True))
+
+
+def fast_path(bookings):
+    """FAST_JSON_RESPONSES: copy fields off the rows, no validation"""
+    return serialization.dumps(serialization.rows_to_dicts(bookings, BOOKING_RESPONSE_FIELDS))
+
+
+def best_per_item(func, bookings, number=20, repeat=5):
+    """Best per-row time in microseconds"""
+    return min(timeit.repeat(lambda: func(bookings), number=number, repeat=repeat)) / number / len(bookings) * 1e6
+
+
+def main():
+    encoder = "orjson" if serialization.orjson is not None else "pydantic-core"
+    print(f"fast path encoder: {encoder}")
+    print(f"{'rows':>6} {'response_model':>15} {'adapter':>10} {'fast':>10} {'speedup':>8}")
+    for count in (10, 100, 500, 2000):
+        bookings = make_bookings(count)
+        assert json.loads(fast_path(bookings)) == json.loads(response_model_path(bookings))
+
+        default = best_per_item(response_model_path, bookings)
+        adapter = best_per_item(adapter_path, bookings)
+        fast = best_per_item(fast_path, bookings)
+        print(
+            f"{count:>6} {default:>13.2f}us {adapter:>8.2f}us {fast:>8.2f}us "
+            f"{default / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
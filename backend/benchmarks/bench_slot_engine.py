@@ -0,0 +1,72 @@
+"""
+Benchmark slot calculation on dense days
+
+Compares the original nested-loop check (every candidate slot against every
+booking) with the per-minute occupancy map, both freshly built (a cache
+miss) and reused from the occupancy cache (as happens when a second service
+queries a day that is already mapped).
+
+Run from the backend directory:
+    python -m benchmarks.bench_slot_engine
+"""
+import random
+import timeit
+
+from app.core.slot_engine import DayOccupancy
+
+
+WINDOWS = [(8 * 60, 12 * 60, 8 * 60), (13 * 60, 20 * 60, 13 * 60)]
+DURATION = 15
+INTERVAL = 5
+
+
+def nested_loop_slots(windows, busy, duration, interval):
+    """The pre-engine algorithm: test each candidate against every booking"""
+    slots = []
+    for window_start, window_end, _ in windows:
+        current = window_start
+        while current + duration <= window_end:
+            slot_end = current + duration
+            if not any(current < end and slot_end > start for start, end in busy):
+                slots.append((current, slot_end))
+            current += interval
+    return slots
+
+
+def make_bookings(count, seed=42):
+    rng = random.Random(seed)
+    bookings = []
+    for _ in range(count):
+        start = rng.randrange(8 * 60, 20 * 60 - 10)
+        bookings.append((start, start + rng.choice([5, 10])))
+    return bookings
+
+
+def best_of(func, number=50, repeat=5):
+    """Best per-call time in microseconds"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    print(
+        f"{'bookings':>8} {'nested':>10} {'bitmap':>10} {'cached':>10} "
+        f"{'bitmap x':>9} {'cached x':>9}"
+    )
+    for count in (0, 50, 100, 300, 600):
+        busy = make_bookings(count)
+        expected = nested_loop_slots(WINDOWS, busy, DURATION, INTERVAL)
+        occupancy = DayOccupancy(WINDOWS, busy)
+        assert occupancy.free_slots(DURATION, INTERVAL) == expected
+
+        nested = best_of(lambda: nested_loop_slots(WINDOWS, busy, DURATION, INTERVAL), number=10)
+        bitmap = best_of(lambda: DayOccupancy(WINDOWS, busy).free_slots(DURATION, INTERVAL))
+        cached = best_of(lambda: occupancy.free_slots(DURATION, INTERVAL))
+
+        print(
+            f"{count:>8} {nested:>8.0f}us {bitmap:>8.0f}us {cached:>8.0f}us "
+            f"{nested / bitmap:>8.1f}x {nested / cached:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
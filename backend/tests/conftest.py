@@ -0,0 +1,114 @@
+"""
+Shared test fixtures
+
+The app runs against a throwaway SQLite database created once per test
+session. Every test starts from empty tables and cold in-process caches.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+_database_dir = tempfile.mkdtemp(prefix="booking-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_database_dir}/test.db"
+os.environ["DEBUG"] = "false"
+
+import pytest  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import SQLModel, Session, select  # noqa: E402
+
+from app.core.availability_template import availability_template  # noqa: E402
+from app.core.cache import analytics_cache, occupancy_cache, slot_cache  # noqa: E402
+from app.core.database import create_db_and_tables, engine  # noqa: E402
+from app.core.holds import hold_store  # noqa: E402
+from app.core.service_catalog import service_catalog  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    create_db_and_tables()
+    yield engine
+
+
+@pytest.fixture(autouse=True)
+def clean_state(database):
+    """Empty every table and in-process cache before each test"""
+    with database.begin() as connection:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            connection.execute(table.delete())
+    for cache in (slot_cache, occupancy_cache, analytics_cache):
+        cache.clear()
+    hold_store.__init__()
+    availability_template.invalidate()
+    with Session(database) as session:
+        service_catalog.refresh(session)
+
+
+def api_client() -> AsyncClient:
+    """A client calling the app in process, with its own cookie jar"""
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture
+async def client():
+    async with api_client() as client:
+        yield client
+
+
+@pytest.fixture
+async def open_client():
+    """Factory for extra clients, e.g. one per user, closed after the test"""
+    opened = []
+
+    def open_client() -> AsyncClient:
+        opened.append(api_client())
+        return opened[-1]
+
+    yield open_client
+    for client in opened:
+        await client.aclose()
+
+
+async def login(client: AsyncClient, email: str, admin: bool = False) -> None:
+    """Sign up and log in, leaving the session cookie on the client"""
+    await client.post("/auth/signup", json={"email": email, "password": "secret", "full_name": email})
+    if admin:
+        with Session(engine) as session:
+            user = session.exec(select(User).where(User.email == email)).one()
+            user.role = "admin"
+            session.add(user)
+            session.commit()
+    response = await client.post("/auth/login", json={"email": email, "password": "secret"})
+    assert response.status_code == 200, response.text
+
+
+async def create_service(client: AsyncClient, duration_minutes: int = 60, price: float = 50.0) -> int:
+    """Create a service as the logged-in user and return its id"""
+    response = await client.post(
+        "/services/",
+        json={"name": f"Session {duration_minutes}", "duration_minutes": duration_minutes, "price": price}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+@contextmanager
+def capture_statements(engine):
+    """Collect the (sql, parameters) of every statement executed inside the block"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,61 @@
+"""
+Statement counts of admin dashboard endpoints
+
+Each endpoint must run a fixed number of statements however many
+bookings, customers and services it reports on.
+"""
+from datetime import date, time, timedelta
+
+import pytest
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.models.booking import Booking
+from app.models.service import Service
+from app.models.user import User
+from tests.conftest import capture_statements, login
+
+
+pytestmark = pytest.mark.anyio
+
+
+def add_confirmed_bookings(first: int, count: int) -> None:
+    """Add bookings numbered first.. each with its own customer and service"""
+    with Session(engine) as session:
+        for number in range(first, first + count):
+            user = User(email=f"customer{number}@example.com", hashed_password="-", full_name=f"Customer {number}")
+            service = Service(name=f"Service {number}", duration_minutes=60, price=10.0 + number)
+            session.add(user)
+            session.add(service)
+            session.flush()
+            session.add(Booking(
+                user_id=user.id,
+                service_id=service.id,
+                booking_date=date(2030, 1, 1) + timedelta(days=number),
+                start_time=time(10, 0),
+                end_time=time(11, 0),
+                status="confirmed"
+            ))
+        session.commit()
+
+
+async def count_statements(client, path: str) -> int:
+    with capture_statements(engine) as statements:
+        response = await client.get(path)
+    assert response.status_code == 200, response.text
+    return len(statements)
+
+
+@pytest.mark.parametrize("path", ["/admin/bookings/recent?limit=50", "/admin/revenue/by-service"])
+async def test_admin_report_statement_count_does_not_grow_with_rows(client, path):
+    await login(client, "admin@example.com", admin=True)
+
+    add_confirmed_bookings(0, 1)
+    one_booking = await count_statements(client, path)
+
+    add_confirmed_bookings(1, 49)
+    fifty_bookings = await count_statements(client, path)
+
+    assert one_booking == fifty_bookings
+    response = await client.get(path)
+    assert len(response.json()) == 50
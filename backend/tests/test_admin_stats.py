@@ -0,0 +1,51 @@
+"""
+Dashboard figures from the daily_stats rollup
+
+On SQLite /admin/stats and the bookings time series read the rollup;
+they must agree with aggregating the bookings directly, whatever
+statuses the bookings are in.
+"""
+from datetime import date
+
+import pytest
+from sqlmodel import Session
+
+from app.api.routes.admin import DashboardStats, booking_stats_query
+from app.core.database import engine
+from tests.conftest import create_service, login
+
+
+pytestmark = pytest.mark.anyio
+
+
+def direct_stats() -> DashboardStats:
+    today = date.today()
+    with Session(engine) as session:
+        row = session.exec(booking_stats_query(date(today.year, today.month, 1))).one()
+    return DashboardStats(**dict(zip(DashboardStats.model_fields, row)))
+
+
+async def test_rollup_matches_bookings_after_status_changes(client):
+    await login(client, "admin@example.com", admin=True)
+    service_id = await create_service(client, price=40.0)
+    booking_ids = []
+    for start_time in ("09:00", "11:00", "13:00", "15:00"):
+        booking = await client.post(
+            "/bookings/", json={"service_id": service_id, "booking_date": "2030-03-04", "start_time": start_time}
+        )
+        assert booking.status_code == 201, booking.text
+        booking_ids.append(booking.json()["id"])
+
+    for booking_id, new_status in zip(booking_ids, ["confirmed", "completed", "cancelled"]):
+        updated = await client.put(f"/bookings/{booking_id}", json={"status": new_status})
+        assert updated.status_code == 200, updated.text
+
+    stats = (await client.get("/admin/stats")).json()
+    assert stats == direct_stats().model_dump()
+    assert stats["total_bookings"] == 4
+
+    series = await client.get(
+        "/admin/analytics/timeseries",
+        params={"metric": "bookings", "granularity": "month", "from": "2030-03-01", "to": "2030-03-31"}
+    )
+    assert [point["value"] for point in series.json()["points"]] == [4]
@@ -0,0 +1,73 @@
+"""
+Taking bookings out of cancelled
+
+A booking moved back to pending or confirmed goes through the same hold
+and booking conflict check as a new booking.
+"""
+import pytest
+
+from tests.conftest import create_service, login
+
+
+pytestmark = pytest.mark.anyio
+
+SLOT = {"booking_date": "2030-03-04", "start_time": "10:00"}
+
+
+async def cancelled_booking(admin):
+    """A service and one of the admin's bookings on SLOT, cancelled"""
+    service_id = await create_service(admin)
+    booking = await admin.post("/bookings/", json={"service_id": service_id, **SLOT})
+    assert booking.status_code == 201, booking.text
+    booking_id = booking.json()["id"]
+    assert (await admin.delete(f"/bookings/{booking_id}")).status_code == 204
+    return service_id, booking_id
+
+
+async def booking_status(client, booking_id):
+    return (await client.get(f"/bookings/{booking_id}")).json()["status"]
+
+
+async def test_bulk_uncancel_restores_a_free_slot(open_client):
+    admin = open_client()
+    await login(admin, "admin@example.com", admin=True)
+    _, booking_id = await cancelled_booking(admin)
+
+    response = await admin.post("/admin/bookings/status", json={"booking_ids": [booking_id], "status": "confirmed"})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["updated"] == [booking_id]
+    assert await booking_status(admin, booking_id) == "confirmed"
+
+
+@pytest.mark.parametrize("taken_by", ["booking", "hold"])
+async def test_bulk_uncancel_rejects_a_taken_slot(open_client, taken_by):
+    admin, customer = open_client(), open_client()
+    await login(admin, "admin@example.com", admin=True)
+    service_id, booking_id = await cancelled_booking(admin)
+    await login(customer, "customer@example.com")
+    taken = await customer.post(
+        "/bookings/" if taken_by == "booking" else "/bookings/holds",
+        json={"service_id": service_id, **SLOT}
+    )
+    assert taken.status_code == 201, taken.text
+
+    response = await admin.post("/admin/bookings/status", json={"booking_ids": [booking_id], "status": "pending"})
+
+    assert response.status_code == 409
+    assert str(booking_id) in response.json()["detail"]
+    assert await booking_status(admin, booking_id) == "cancelled"
+
+
+async def test_single_uncancel_rejects_a_held_slot(open_client):
+    admin, customer = open_client(), open_client()
+    await login(admin, "admin@example.com", admin=True)
+    service_id, booking_id = await cancelled_booking(admin)
+    await login(customer, "customer@example.com")
+    held = await customer.post("/bookings/holds", json={"service_id": service_id, **SLOT})
+    assert held.status_code == 201, held.text
+
+    response = await admin.put(f"/bookings/{booking_id}", json={"status": "pending"})
+
+    assert response.status_code == 409
+    assert await booking_status(admin, booking_id) == "cancelled"
@@ -0,0 +1,40 @@
+"""
+Availability template expiry
+
+Rule writes in other worker processes never invalidate this process's
+compiled template, so it must be recompiled on its own.
+"""
+from datetime import time
+
+import pytest
+from sqlmodel import Session
+
+from app.core import availability_template as template_module
+from app.core.availability_template import availability_template
+from app.core.config import settings
+from app.core.database import engine
+from app.models.availability import Availability
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake monotonic clock for the template module, advanced by hand"""
+    now = [1000.0]
+    monkeypatch.setattr(template_module, "monotonic", lambda: now[0])
+    return now
+
+
+def test_rules_written_elsewhere_appear_after_ttl(clock):
+    assert availability_template.ttl_seconds == settings.AVAILABILITY_TEMPLATE_TTL_SECONDS > 0
+    with Session(engine) as session:
+        assert availability_template.get(session) == {}
+
+        # Added without invalidating, as another worker would
+        session.add(Availability(day_of_week=0, start_time=time(9, 0), end_time=time(12, 0)))
+        session.commit()
+
+        clock[0] += settings.AVAILABILITY_TEMPLATE_TTL_SECONDS
+        assert availability_template.get(session) == {}
+
+        clock[0] += 1
+        assert availability_template.get(session) == {0: [(540, 720, 540)]}
@@ -0,0 +1,57 @@
+"""
+Concurrent booking writes
+
+Routes use sync sessions on the event loop, so a request that waits for a
+database connection stalls every other request. These tests fire hundreds
+of bookings at once and expect every one of them to get an answer.
+"""
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from tests.conftest import create_service, login
+
+
+REQUESTS = 300
+TIMEOUT_SECONDS = 60
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_parallel_bookings_for_one_slot_create_exactly_one(client):
+    await login(client, "customer@example.com")
+    service_id = await create_service(client)
+    booking = {"service_id": service_id, "booking_date": "2030-03-04", "start_time": "10:00"}
+
+    responses = await asyncio.wait_for(
+        asyncio.gather(*(client.post("/bookings/", json=booking) for _ in range(REQUESTS))),
+        TIMEOUT_SECONDS
+    )
+
+    codes = [response.status_code for response in responses]
+    assert codes.count(201) == 1
+    assert codes.count(409) == REQUESTS - 1
+
+    listed = await client.get("/bookings/", params={"limit": 10})
+    assert len(listed.json()) == 1
+
+
+async def test_parallel_bookings_on_distinct_dates_all_succeed(client):
+    await login(client, "customer@example.com")
+    service_id = await create_service(client)
+    first_day = date(2031, 1, 1)
+
+    responses = await asyncio.wait_for(
+        asyncio.gather(*(
+            client.post("/bookings/", json={
+                "service_id": service_id,
+                "booking_date": (first_day + timedelta(days=offset)).isoformat(),
+                "start_time": "10:00"
+            })
+            for offset in range(REQUESTS)
+        )),
+        TIMEOUT_SECONDS
+    )
+
+    assert [response.status_code for response in responses] == [201] * REQUESTS
@@ -0,0 +1,22 @@
+"""
+Query plans of booking queries
+"""
+from datetime import date, time
+
+from sqlmodel import Session
+
+from app.api.routes.bookings import check_booking_conflict
+from tests.conftest import capture_statements
+
+
+def test_conflict_check_uses_covering_index(database):
+    with Session(database) as session:
+        with capture_statements(database) as statements:
+            check_booking_conflict(session, date(2030, 3, 4), time(10, 0), time(11, 0))
+        assert len(statements) == 1
+        sql, parameters = statements[0]
+
+        plan = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", parameters).all()
+
+    details = " | ".join(row[-1] for row in plan)
+    assert "USING COVERING INDEX ix_booking_date_status_times" in details, details
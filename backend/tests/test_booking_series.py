@@ -0,0 +1,29 @@
+"""
+Recurring booking series
+"""
+import pytest
+
+from tests.conftest import create_service, login
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_reschedule_skips_occurrences_that_no_longer_hold_a_slot(client):
+    await login(client, "admin@example.com", admin=True)
+    service_id = await create_service(client)
+    series = await client.post("/bookings/series", json={
+        "service_id": service_id, "start_date": "2030-03-04", "start_time": "10:00", "count": 3
+    })
+    assert series.status_code == 201, series.text
+    series_id = series.json()["series_id"]
+    first_id = series.json()["bookings"][0]["id"]
+    completed = await client.put(f"/bookings/{first_id}", json={"status": "completed"})
+    assert completed.status_code == 200, completed.text
+
+    moved = await client.put(f"/bookings/series/{series_id}", json={"start_time": "14:00"})
+
+    assert moved.status_code == 200, moved.text
+    assert [
+        (booking["status"], booking["start_time"]) for booking in moved.json()["bookings"]
+    ] == [("completed", "10:00:00"), ("pending", "14:00:00"), ("pending", "14:00:00")]
@@ -0,0 +1,33 @@
+"""
+Bulk booking on behalf of other users
+
+Each item is checked against the holds of every user except the one it
+books for, whoever sends the request.
+"""
+import pytest
+
+from tests.conftest import create_service, login
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_admin_bulk_booking_ignores_only_the_booked_users_holds(open_client):
+    admin, customer = open_client(), open_client()
+    await login(admin, "admin@example.com", admin=True)
+    await login(customer, "customer@example.com")
+    service_id = await create_service(admin)
+    customer_id = (await customer.get("/auth/me")).json()["id"]
+    for client, start_time in ((customer, "10:00:00"), (admin, "12:00:00")):
+        hold = await client.post("/bookings/holds", json={
+            "service_id": service_id, "booking_date": "2030-03-04", "start_time": start_time
+        })
+        assert hold.status_code == 201, hold.text
+
+    response = await admin.post("/bookings/bulk", json={"mode": "best_effort", "items": [
+        {"service_id": service_id, "booking_date": "2030-03-04", "start_time": start_time, "user_id": customer_id}
+        for start_time in ("10:00:00", "12:00:00")
+    ]})
+
+    assert response.status_code == 201, response.text
+    assert [result["status"] for result in response.json()["results"]] == ["created", "conflict"]
@@ -0,0 +1,46 @@
+"""
+LRUCache expiry
+
+Other worker processes never invalidate this process's caches, so
+entries must age out on their own.
+"""
+import pytest
+
+from app.core import cache
+from app.core.cache import LRUCache, analytics_cache, occupancy_cache, slot_cache
+from app.core.config import settings
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake monotonic clock for the cache module, advanced by hand"""
+    now = [1000.0]
+    monkeypatch.setattr(cache, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    lru = LRUCache(maxsize=10, ttl_seconds=30)
+    lru.set("key", "value")
+
+    clock[0] += 29
+    assert lru.get("key") == "value"
+
+    clock[0] += 2
+    assert lru.get("key") is None
+    assert len(lru) == 0
+    assert lru.stats()["expirations"] == 1
+
+
+def test_zero_ttl_keeps_entries(clock):
+    lru = LRUCache(maxsize=10)
+    lru.set("key", "value")
+
+    clock[0] += 10 ** 6
+    assert lru.get("key") == "value"
+
+
+def test_shared_caches_have_a_ttl():
+    assert slot_cache.ttl_seconds == settings.SLOT_CACHE_TTL_SECONDS > 0
+    assert occupancy_cache.ttl_seconds == settings.SLOT_CACHE_TTL_SECONDS
+    assert analytics_cache.ttl_seconds == settings.ANALYTICS_CACHE_TTL_SECONDS > 0
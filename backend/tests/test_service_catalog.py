@@ -0,0 +1,45 @@
+"""
+Service catalog lookups
+
+Misses for unknown ids must not reload the catalog; services created by
+another worker must still be found.
+"""
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.core.service_catalog import service_catalog
+from app.models.service import Service
+from tests.conftest import capture_statements
+
+
+def add_service_elsewhere(name: str) -> int:
+    """Insert a service without telling the catalog, as another worker would"""
+    with Session(engine) as session:
+        service = Service(name=name, duration_minutes=30, price=20.0)
+        session.add(service)
+        session.commit()
+        return service.id
+
+
+def test_unknown_id_costs_one_query_and_no_reload():
+    add_service_elsewhere("Known")
+    with Session(engine) as session:
+        service_catalog.refresh(session)
+        reloads = service_catalog.reloads
+
+        with capture_statements(engine) as statements:
+            assert service_catalog.get(session, 999999) is None
+            assert service_catalog.get_many(session, [999998, 999999]) == {}
+
+    assert service_catalog.reloads == reloads
+    assert len(statements) == 2
+
+
+def test_service_created_by_another_worker_is_found():
+    with Session(engine) as session:
+        service_catalog.refresh(session)
+        first_id = add_service_elsewhere("First")
+        second_id = add_service_elsewhere("Second")
+
+        assert service_catalog.get(session, first_id).name == "First"
+        assert set(service_catalog.get_many(session, [first_id, second_id, 999999])) == {first_id, second_id}
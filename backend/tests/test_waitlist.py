@@ -0,0 +1,145 @@
+"""
+Waitlist offers through their whole lifecycle
+
+Freed slots are offered to the oldest waiting entry. An offer ends as
+booked when its hold is confirmed, or expired when the hold is released
+or lapses, and an expired offer passes the slot to the next entry.
+"""
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlmodel import Session, select
+
+from app.api.routes.bookings import expire_waitlist_offers
+from app.core.database import engine
+from app.core.holds import hold_store
+from app.models.booking import Booking
+from app.models.waitlist import WaitlistEntry
+from tests.conftest import create_service, login
+
+
+pytestmark = pytest.mark.anyio
+
+SLOT = {"booking_date": "2030-03-04", "start_time": "10:00:00"}
+
+
+def entry_statuses():
+    """Status of every waitlist entry, oldest first"""
+    with Session(engine) as session:
+        return [entry.status for entry in session.exec(select(WaitlistEntry).order_by(WaitlistEntry.id))]
+
+
+async def offered_hold_id(client):
+    entries = (await client.get("/bookings/waitlist")).json()
+    assert [entry["status"] for entry in entries] == ["offered"]
+    return entries[0]["hold_id"]
+
+
+async def booked_slot_with_waitlist(open_client):
+    """An owner's booking on SLOT and two customers waiting for it, in order"""
+    owner, first, second = open_client(), open_client(), open_client()
+    await login(owner, "owner@example.com")
+    service_id = await create_service(owner)
+    booking = await owner.post("/bookings/", json={"service_id": service_id, **SLOT})
+    assert booking.status_code == 201, booking.text
+    for customer, email in ((first, "first@example.com"), (second, "second@example.com")):
+        await login(customer, email)
+        joined = await customer.post("/bookings/waitlist", json={"service_id": service_id, **SLOT})
+        assert joined.status_code == 201, joined.text
+    return owner, first, second, booking.json()["id"]
+
+
+async def test_confirming_an_offer_marks_the_entry_booked(open_client):
+    owner, first, second, booking_id = await booked_slot_with_waitlist(open_client)
+    assert (await owner.delete(f"/bookings/{booking_id}")).status_code == 204
+
+    hold_id = await offered_hold_id(first)
+    confirmed = await first.post(f"/bookings/holds/{hold_id}/confirm")
+
+    assert confirmed.status_code == 201, confirmed.text
+    assert entry_statuses() == ["booked", "waiting"]
+    assert (await first.get("/bookings/waitlist")).json() == []
+
+
+async def test_confirming_an_offer_booked_elsewhere_is_a_conflict(open_client):
+    owner, first, second, booking_id = await booked_slot_with_waitlist(open_client)
+    await owner.delete(f"/bookings/{booking_id}")
+    hold_id = await offered_hold_id(first)
+
+    # Another worker, which does not see this process's holds, books the slot
+    with Session(engine) as session:
+        cancelled = session.get(Booking, booking_id)
+        session.add(Booking(
+            user_id=cancelled.user_id,
+            service_id=cancelled.service_id,
+            booking_date=date(2030, 3, 4),
+            start_time=time(10, 30),
+            end_time=time(11, 30)
+        ))
+        session.commit()
+
+    confirmed = await first.post(f"/bookings/holds/{hold_id}/confirm")
+
+    assert confirmed.status_code == 409, confirmed.text
+    assert entry_statuses() == ["offered", "waiting"]
+
+
+async def test_leaving_with_an_offer_passes_the_slot_on(open_client):
+    owner, first, second, booking_id = await booked_slot_with_waitlist(open_client)
+    await owner.delete(f"/bookings/{booking_id}")
+    hold_id = await offered_hold_id(first)
+    entry_id = (await first.get("/bookings/waitlist")).json()[0]["id"]
+
+    assert (await first.delete(f"/bookings/waitlist/{entry_id}")).status_code == 204
+
+    assert hold_store.get(hold_id) is None
+    assert entry_statuses() == ["removed", "offered"]
+    await offered_hold_id(second)
+
+
+async def test_releasing_an_offer_passes_the_slot_on(open_client):
+    owner, first, second, booking_id = await booked_slot_with_waitlist(open_client)
+    await owner.delete(f"/bookings/{booking_id}")
+
+    hold_id = await offered_hold_id(first)
+    assert (await first.delete(f"/bookings/holds/{hold_id}")).status_code == 204
+
+    assert entry_statuses() == ["expired", "offered"]
+    await offered_hold_id(second)
+
+
+async def test_lapsed_offer_passes_the_slot_on(open_client):
+    owner, first, second, booking_id = await booked_slot_with_waitlist(open_client)
+    await owner.delete(f"/bookings/{booking_id}")
+    hold_id = await offered_hold_id(first)
+
+    # Let the offer lapse: its hold is gone and it was made long enough ago
+    hold_store.release(hold_id)
+    with Session(engine) as session:
+        entry = session.exec(select(WaitlistEntry).where(WaitlistEntry.hold_id == hold_id)).one()
+        entry.offered_at = datetime.utcnow() - timedelta(hours=1)
+        session.add(entry)
+        session.commit()
+
+    await expire_waitlist_offers()
+
+    assert entry_statuses() == ["expired", "offered"]
+    await offered_hold_id(second)
+
+
+async def test_rescheduling_a_series_offers_the_vacated_slots(open_client):
+    owner, waiting = open_client(), open_client()
+    await login(owner, "owner@example.com")
+    service_id = await create_service(owner)
+    series = await owner.post("/bookings/series", json={
+        "service_id": service_id, "start_date": SLOT["booking_date"], "start_time": "10:00", "count": 2
+    })
+    assert series.status_code == 201, series.text
+
+    await login(waiting, "waiting@example.com")
+    await waiting.post("/bookings/waitlist", json={"service_id": service_id, **SLOT})
+
+    moved = await owner.put(f"/bookings/series/{series.json()['series_id']}", json={"start_time": "14:00"})
+
+    assert moved.status_code == 200, moved.text
+    await offered_hold_id(waiting)
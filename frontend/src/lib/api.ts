@@ -11,12 +11,20 @@ import type {
   Availability,
   AvailabilityCreate,
   AvailableSlotsResponse,
+  AvailableSlotsRangeResponse,
   AdminStats,
+  TimeseriesMetric,
+  TimeseriesGranularity,
+  TimeseriesResponse,
+  UtilizationResponse,
   ApiError,
 } from '@/types';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || '/api';
 
+// Largest page GET /bookings serves (MAX_BOOKINGS_PAGE_SIZE on the backend)
+const BOOKINGS_PAGE_SIZE = 500;
+
 class ApiClient {
   private baseUrl: string;
 
@@ -28,6 +36,14 @@ class ApiClient {
     endpoint: string,
     options: RequestInit = {}
   ): Promise<T> {
+    const { data } = await this.requestWithHeaders<T>(endpoint, options);
+    return data;
+  }
+
+  private async requestWithHeaders<T>(
+    endpoint: string,
+    options: RequestInit = {}
+  ): Promise<{ data: T; headers: Headers }> {
     const url = `${this.baseUrl}${endpoint}`;
 
     const config: RequestInit = {
@@ -44,7 +60,7 @@ class ApiClient {
 
       // Handle non-JSON responses (like 204 No Content)
       if (response.status === 204) {
-        return {} as T;
+        return { data: {} as T, headers: response.headers };
       }
 
       const data = await response.json();
@@ -54,7 +70,7 @@ class ApiClient {
         throw new Error(error.detail || 'An error occurred');
       }
 
-      return data as T;
+      return { data: data as T, headers: response.headers };
     } catch (error) {
       if (error instanceof Error) {
         throw error;
@@ -63,6 +79,22 @@ class ApiClient {
     }
   }
 
+  // Follows X-Next-Cursor until the last page of a cursor-paginated list
+  private async requestAllPages<T>(endpoint: string): Promise<T[]> {
+    const separator = endpoint.includes('?') ? '&' : '?';
+    const items: T[] = [];
+    let cursor: string | null = null;
+    do {
+      const page = cursor
+        ? `${endpoint}${separator}cursor=${encodeURIComponent(cursor)}`
+        : endpoint;
+      const { data, headers } = await this.requestWithHeaders<T[]>(page);
+      items.push(...data);
+      cursor = headers.get('X-Next-Cursor');
+    } while (cursor);
+    return items;
+  }
+
   // Authentication endpoints
   auth = {
     signup: (data: SignupRequest) =>
@@ -91,6 +123,9 @@ class ApiClient {
 
     getById: (id: number) => this.request<Service>(`/services/${id}`),
 
+    getByIds: (ids: number[]) =>
+      this.request<Service[]>(`/services?ids=${ids.join(',')}`),
+
     create: (data: ServiceCreate) =>
       this.request<Service>('/services', {
         method: 'POST',
@@ -111,10 +146,14 @@ class ApiClient {
 
   // Bookings endpoints
   bookings = {
-    getAll: () => this.request<Booking[]>('/bookings'),
+    getAll: () =>
+      this.requestAllPages<Booking>(`/bookings?limit=${BOOKINGS_PAGE_SIZE}`),
 
     getById: (id: number) => this.request<Booking>(`/bookings/${id}`),
 
+    getByIds: (ids: number[]) =>
+      this.request<Booking[]>(`/bookings?ids=${ids.join(',')}`),
+
     create: (data: BookingCreate) =>
       this.request<Booking>('/bookings', {
         method: 'POST',
@@ -158,11 +197,29 @@ class ApiClient {
       this.request<AvailableSlotsResponse>(
         `/availability/slots?target_date=${date}&service_id=${serviceId}`
       ),
+
+    getSlotsRange: (serviceId: number, start: string, end: string) =>
+      this.request<AvailableSlotsRangeResponse>(
+        `/availability/slots/range?service_id=${serviceId}&start=${start}&end=${end}`
+      ),
   };
 
   // Admin endpoints
   admin = {
     getStats: () => this.request<AdminStats>('/admin/stats'),
+
+    getTimeseries: (
+      metric: TimeseriesMetric,
+      granularity: TimeseriesGranularity,
+      from: string,
+      to: string
+    ) =>
+      this.request<TimeseriesResponse>(
+        `/admin/analytics/timeseries?metric=${metric}&granularity=${granularity}&from=${from}&to=${to}`
+      ),
+
+    getUtilization: (from: string, to: string) =>
+      this.request<UtilizationResponse>(`/admin/analytics/utilization?from=${from}&to=${to}`),
   };
 }
 
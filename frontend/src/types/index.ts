@@ -98,6 +98,13 @@ export interface AvailableSlotsResponse {
   available_slots: TimeSlot[];
 }
 
+export interface AvailableSlotsRangeResponse {
+  service_id: number;
+  start: string;
+  end: string;
+  days: AvailableSlotsResponse[];
+}
+
 // Admin types
 export interface AdminStats {
   total_bookings: number;
@@ -107,6 +114,38 @@ export interface AdminStats {
   active_services: number;
 }
 
+export type TimeseriesMetric = 'bookings' | 'revenue';
+export type TimeseriesGranularity = 'day' | 'week' | 'month';
+
+export interface TimeseriesPoint {
+  period_start: string;
+  value: number;
+}
+
+export interface TimeseriesResponse {
+  metric: TimeseriesMetric;
+  granularity: TimeseriesGranularity;
+  date_from: string;
+  date_to: string;
+  points: TimeseriesPoint[];
+}
+
+export interface UtilizationDay {
+  day: string;
+  available_minutes: number;
+  booked_minutes: number;
+  utilization: number | null;
+}
+
+export interface UtilizationResponse {
+  date_from: string;
+  date_to: string;
+  available_minutes: number;
+  booked_minutes: number;
+  utilization: number | null;
+  days: UtilizationDay[];
+}
+
 // API Error type
 export interface ApiError {
   detail: string;